@@ -73,8 +73,26 @@ def main() -> None:
     if not token:
         raise SystemExit("DISCORD_TOKEN not set in .env")
 
+    # Use the libuv event loop when available (optional uvloop>=0.18); stdlib asyncio otherwise
+    try:
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        run = uvloop.run
+        log.info("Using uvloop event loop")
+
     bot = Essusic()
-    bot.run(token, log_handler=None)
+    try:
+        run(_start(bot, token))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _start(bot: Essusic, token: str) -> None:
+    # Same as bot.run(), minus the event loop it would create for us
+    async with bot:
+        await bot.start(token)
 
 
 if __name__ == "__main__":
@@ -2,26 +2,36 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import concurrent.futures
+import functools
+import inspect
+import io
+import itertools
 import json
 import logging
-import math
 import re
 import time
+from dataclasses import replace
 from typing import Optional
 from urllib.parse import parse_qs, urlparse
 
 import aiohttp
 import discord
+import yarl
 from discord import app_commands
 from discord.ext import commands
 
 from music.audio_source import (
     AUDIO_FILTERS,
+    EQ_BANDS,
     EQ_PRESETS,
     CrossfadeSource,
     TrackInfo,
     YTDLSource,
+    ytdl_extract,
 )
+from music.cache import TTLCache
+from music.i18n import available_locales, has_locale
 from music.metrics import (
     active_players as metric_active_players,
     playback_errors_total,
@@ -33,6 +43,7 @@ from music.queue_manager import (
     FavoritesManager,
     GuildQueue,
     HistoryManager,
+    LoopMode,
     PlaylistManager,
     QueueManager,
     RatingsManager,
@@ -42,6 +53,23 @@ from music.url_parser import InputType, classify
 
 log = logging.getLogger(__name__)
 
+# orjson parses the large syncedLyrics payloads noticeably faster; optional
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+_EQ_BAND_NAMES = tuple(label for label, _ in EQ_BANDS)
+
+# Embed colours, built once rather than per command
+_COLOR_BLUE = discord.Color.blue()
+_COLOR_BLURPLE = discord.Color.blurple()
+_COLOR_DARK_GREY = discord.Color.dark_grey()
+_COLOR_GOLD = discord.Color.gold()
+_COLOR_GREEN = discord.Color.green()
+_COLOR_PURPLE = discord.Color.purple()
 
 _YT_JUNK_RE = re.compile(
     r"\s*[\(\[]"
@@ -62,6 +90,19 @@ def _clean_title(title: str) -> str:
     return title.strip(" -–—|")
 
 
+# Parsed once; aiohttp only has to merge the query into these per request
+_LRCLIB_GET_URL = yarl.URL("https://lrclib.net/api/get")
+_LRCLIB_SEARCH_URL = yarl.URL("https://lrclib.net/api/search")
+_BRACKETED_RE = re.compile(r"[\(\[].*?[\)\]]")
+_LYRICS_KEYS = ("trackName", "artistName", "plainLyrics", "syncedLyrics")
+
+
+def _normalize_query(query: str) -> str:
+    """Lyrics cache key: lowercased, bracketed suffixes dropped, whitespace collapsed."""
+    return " ".join(_BRACKETED_RE.sub(" ", query.lower()).split())
+
+
+@functools.lru_cache(maxsize=4096)
 def format_duration(seconds: int) -> str:
     if seconds <= 0:
         return "LIVE"
@@ -72,50 +113,180 @@ def format_duration(seconds: int) -> str:
     return f"{m}:{s:02d}"
 
 
+@functools.lru_cache(maxsize=256)
+def _seek_segments(duration: int, count: int) -> tuple[tuple[int, int, str], ...]:
+    """(start, end, idle label) for each seek-bar segment; fixed for a given track length."""
+    segments = []
+    for i in range(count):
+        start = int(duration * i / count)
+        segments.append((start, int(duration * (i + 1) / count), f"\u25ac {format_duration(start)}"))
+    return tuple(segments)
+
+
+@functools.lru_cache(maxsize=None)
+def _bar_table(length: int) -> tuple[str, ...]:
+    """Every possible bar of *length* cells, indexed by how many are filled."""
+    return tuple("▬" * i + "🔘" + "▬" * (length - i) for i in range(length + 1))
+
+
 def progress_bar(elapsed: int, total: int, length: int = 12) -> str:
     if total <= 0:
         return f"{format_duration(elapsed)} / LIVE"
     elapsed = min(elapsed, total)
-    filled = round(length * elapsed / total)
-    bar = "▬" * filled + "🔘" + "▬" * (length - filled)
+    filled = (2 * length * elapsed + total) // (2 * total)  # rounded, in integers
+    bar = _bar_table(length)[filled]
     return f"{format_duration(elapsed)} {bar} {format_duration(total)}"
 
 
+_TIME_RE = re.compile(r"(?:(?:(\d+):)?(\d+):)?(\d+)")
+# YouTube Mix playlists have list IDs starting with RD
+_MIX_RE = re.compile(r"[?&]list=RD")
+
+
 def parse_time(value: str) -> int | None:
     """Parse '90', '1:30', or '1:30:00' into seconds. Returns None on failure."""
-    parts = value.strip().split(":")
-    try:
-        nums = [int(p) for p in parts]
-    except ValueError:
+    value = value.strip()
+    if len(value) > 12:  # longer than any real track position; don't scan it
+        return None
+    m = _TIME_RE.fullmatch(value)
+    if m is None:
         return None
-    if len(nums) == 1:
-        return nums[0]
-    if len(nums) == 2:
-        return nums[0] * 60 + nums[1]
-    if len(nums) == 3:
-        return nums[0] * 3600 + nums[1] * 60 + nums[2]
-    return None
+    h, mins, secs = m.groups()
+    return int(h or 0) * 3600 + int(mins or 0) * 60 + int(secs)
+
+
+_DJ_CHECK_TTL = 2.0  # seconds a DJ verdict is reused for the same user
 
 
 def _check_dj(interaction: discord.Interaction, gq: GuildQueue) -> str | None:
-    """Return None if the user is authorized, or an error message string."""
+    """Return None if the user is authorized, or an error message string.
+
+    Verdicts are cached on the GuildQueue for a couple of seconds so rapid
+    button presses don't rescan roles and voice members on every click.
+    """
     if gq.dj_role_id is None:
         return None
+    now = time.monotonic()
+    cached = gq.dj_cache.get(interaction.user.id)
+    if cached and cached[0] > now and cached[1] == gq.dj_role_id:
+        return cached[2]
+    # Drop expired and stale-role verdicts so the cache only holds recent users
+    for uid in [uid for uid, (expires, role_id, _) in gq.dj_cache.items() if expires <= now or role_id != gq.dj_role_id]:
+        del gq.dj_cache[uid]
+    result = _dj_verdict(interaction, gq)
+    gq.dj_cache[interaction.user.id] = (now + _DJ_CHECK_TTL, gq.dj_role_id, result)
+    return result
+
+
+def _dj_verdict(interaction: discord.Interaction, gq: GuildQueue) -> str | None:
     member = interaction.user
     if member.guild_permissions.administrator:  # type: ignore[union-attr]
         return None
-    if any(r.id == gq.dj_role_id for r in member.roles):  # type: ignore[union-attr]
+    # get_role checks the member's sorted role-id list instead of building Member.roles
+    if member.get_role(gq.dj_role_id) is not None:  # type: ignore[union-attr, arg-type]
         return None
-    # Allow if user is alone with bot in VC
+    # Allow if user is alone with bot in VC; stop counting at the second human
     if member.voice and member.voice.channel:  # type: ignore[union-attr]
-        non_bot = [m for m in member.voice.channel.members if not m.bot]  # type: ignore[union-attr]
-        if len(non_bot) <= 1:
+        humans = (m for m in member.voice.channel.members if not m.bot)  # type: ignore[union-attr]
+        if sum(1 for _ in itertools.islice(humans, 2)) <= 1:
             return None
     role = interaction.guild.get_role(gq.dj_role_id)  # type: ignore[union-attr]
     role_name = role.name if role else "DJ"
     return f"You need the **{role_name}** role to use this command."
 
 
+_VIDEO_INFO_KEYS = ("title", "webpage_url", "duration", "thumbnail", "artist", "uploader")
+_PLAYLIST_ENTRY_KEYS = ("id", "title", "duration", "thumbnail", "webpage_url", "url")
+
+
+def _trim_video_info(data: dict) -> dict:
+    """Keep only the yt-dlp fields /play reads for a single video or search hit."""
+    if "entries" in data:
+        data = data["entries"][0]
+    return {k: data[k] for k in _VIDEO_INFO_KEYS if k in data}
+
+
+def _trim_stream_info(data: dict) -> dict | None:
+    """The fields YTDLSource needs to start playback, or None if no stream was picked."""
+    if "entries" in data:
+        data = data["entries"][0]
+    if not data.get("url"):
+        return None
+    return {k: data[k] for k in ("url", *_VIDEO_INFO_KEYS) if k in data}
+
+
+def _playlist_entry_url(entry: dict) -> str:
+    """Watch URL for a flat playlist entry, built from its ID when no URL was given."""
+    url = entry.get("webpage_url") or entry.get("url", "")
+    if not url and entry.get("id"):
+        url = f"https://www.youtube.com/watch?v={entry['id']}"
+    return url
+
+
+def _trim_playlist_info(data: dict) -> dict:
+    """Keep only the playlist title and the per-entry fields used to queue tracks."""
+    entries = [
+        {k: e[k] for k in _PLAYLIST_ENTRY_KEYS if k in e}
+        for e in data.get("entries") or [] if e is not None
+    ]
+    trimmed: dict = {"entries": entries}
+    if "title" in data:
+        trimmed["title"] = data["title"]
+    return trimmed
+
+
+def _encode_queue_code(tracks: list[dict]) -> str:
+    """Encode exported tracks as the compact base64 JSON used by /queue-export."""
+    return base64.b64encode(json.dumps(tracks, separators=(",", ":")).encode()).decode()
+
+
+def _decode_queue_code(code: str) -> list[tuple[str, str, int]] | None:
+    """Decode a /queue-export code into (title, url, duration) rows, or None if malformed."""
+    try:
+        items = json.loads(base64.b64decode(code.strip().strip("`")))
+    except (ValueError, RecursionError):  # bad base64, UTF-8 or JSON, or JSON nested too deep
+        return None
+    if not isinstance(items, list):
+        return None
+    rows: list[tuple[str, str, int]] = []
+    for item in items:
+        if not isinstance(item, dict):
+            return None
+        title, url, duration = item.get("t", "Unknown"), item.get("u", ""), item.get("d", 0)
+        if not (isinstance(title, str) and isinstance(url, str) and isinstance(duration, int)):
+            return None
+        rows.append((title, url, duration))
+    return rows
+
+
+def _log_write_error(fut: asyncio.Future) -> None:
+    """Done-callback for fire-and-forget executor writes, so failures are logged."""
+    if not fut.cancelled() and (exc := fut.exception()) is not None:
+        log.warning("Background write failed: %s", exc, exc_info=exc)
+
+
+def _require_dj(func):
+    """Resolve the guild queue, enforce DJ access, and pass ``gq`` to the command.
+
+    The wrapped command takes ``gq`` right after ``interaction``; it is hidden
+    from the exposed signature so it never becomes a slash-command option.
+    """
+    sig = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(self: MusicCog, interaction: discord.Interaction, *args, **kwargs):
+        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
+        if err := _check_dj(interaction, gq):
+            await interaction.response.send_message(err, ephemeral=True)
+            return
+        return await func(self, interaction, gq, *args, **kwargs)
+
+    wrapper.__signature__ = sig.replace(  # type: ignore[attr-defined]
+        parameters=[p for name, p in sig.parameters.items() if name != "gq"]
+    )
+    return wrapper
+
+
 class SearchView(discord.ui.View):
     """Buttons for /search results."""
 
@@ -145,13 +316,7 @@ class SearchView(discord.ui.View):
                 return
 
             if vc.is_playing() or vc.is_paused():
-                gq = self.cog.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-                # Prepend track and stop current — _play_next will pick it up immediately
-                gq.queue.appendleft(track)
-                gq._restarting = True
-                vc.stop()
-                gq._restarting = False
-                await self.cog._play_next(interaction.guild)  # type: ignore[arg-type]
+                await self.cog._swap_track(interaction.guild, track)  # type: ignore[arg-type]
                 await interaction.followup.send(f"Now playing: **{track.title}**")
             else:
                 await self.cog._enqueue_and_play(interaction, track)
@@ -214,6 +379,8 @@ class MixConfirmView(discord.ui.View):
 class VoteSkipView(discord.ui.View):
     """Vote-skip button that tracks unique voters."""
 
+    LABEL_FLUSH_DELAY = 0.25  # coalesce bursts of votes into one message edit
+
     def __init__(self, cog: MusicCog, guild: discord.Guild, required: int) -> None:
         super().__init__(timeout=60)
         self.cog = cog
@@ -221,6 +388,7 @@ class VoteSkipView(discord.ui.View):
         self.required = required
         self.voters: set[int] = set()
         self.message: discord.Message | None = None
+        self._pending_edit: asyncio.TimerHandle | None = None
 
     @discord.ui.button(label="Skip (0/0)", style=discord.ButtonStyle.danger)
     async def vote(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
@@ -230,9 +398,10 @@ class VoteSkipView(discord.ui.View):
         gq.skip_votes = set(self.voters)
 
         count = len(self.voters)
-        button.label = f"Skip ({count}/{self.required})"
 
         if count >= self.required:
+            self._cancel_pending_edit()
+            button.label = f"Skip ({count}/{self.required})"
             button.disabled = True
             await interaction.response.edit_message(
                 content=f"Vote skip passed ({count}/{self.required})! Skipping...",
@@ -242,10 +411,37 @@ class VoteSkipView(discord.ui.View):
             vc: Optional[discord.VoiceClient] = self.guild.voice_client  # type: ignore[assignment]
             if vc and vc.is_playing():
                 vc.stop()
-        else:
+        elif self.message is None:
+            button.label = f"Skip ({count}/{self.required})"
             await interaction.response.edit_message(view=self)
+        else:
+            # Acknowledge now, render the label once the burst of votes settles
+            await interaction.response.defer()
+            self._cancel_pending_edit()
+            self._pending_edit = asyncio.get_running_loop().call_later(
+                self.LABEL_FLUSH_DELAY, self._flush_label
+            )
+
+    def _cancel_pending_edit(self) -> None:
+        if self._pending_edit:
+            self._pending_edit.cancel()
+            self._pending_edit = None
+
+    def _flush_label(self) -> None:
+        self._pending_edit = None
+        if self.message is None or self.is_finished():
+            return
+        self.vote.label = f"Skip ({len(self.voters)}/{self.required})"
+        self.cog._spawn(self._edit_label())
+
+    async def _edit_label(self) -> None:
+        try:
+            await self.message.edit(view=self)  # type: ignore[union-attr]
+        except discord.HTTPException:
+            pass
 
     async def on_timeout(self) -> None:
+        self._cancel_pending_edit()
         for item in self.children:
             item.disabled = True  # type: ignore[union-attr]
         if self.message:
@@ -357,51 +553,69 @@ class PlayerView(discord.ui.View):
     """Interactive music player with controls, progress bar, and seek."""
 
     SEEK_SEGMENTS = 5
+    UPDATE_DELAY = 0.1  # seconds to coalesce button-driven message edits
 
     def __init__(self, cog: MusicCog, guild: discord.Guild) -> None:
         super().__init__(timeout=None)
         self.cog = cog
         self.guild = guild
         self.message: discord.Message | None = None
-        self._update_task: asyncio.Task | None = None
+        self._last_render: tuple[dict, list[dict]] | None = None
+        self._rendered_paused = False
+        # (track, position) held while paused so repeated renders come out identical
+        self._paused_at: tuple[TrackInfo, int] | None = None
+        # (track, embed with the parts that stay fixed for that track)
+        self._embed_base: tuple[TrackInfo, discord.Embed] | None = None
+        self._update_handle: asyncio.TimerHandle | None = None
+        self._seek_buttons: list[discord.ui.Button] = []
         self._build_seek_bar()
 
     # ── Clickable seek bar (row 1) ────────────────────────────────────────
 
-    def _build_seek_bar(self) -> None:
+    def _build_seek_bar(self, paused: bool | None = None) -> None:
         """Add a row of buttons that act as a clickable progress bar."""
         gq = self.cog.queues.get(self.guild.id)
         if not gq.current or gq.current.duration <= 0:
             return
-        dur = gq.current.duration
-        elapsed = self.cog._get_elapsed(gq)
+        if paused is None:
+            paused = self._is_paused()
+        elapsed = self._position(gq, paused)
+        segments = _seek_segments(gq.current.duration, self.SEEK_SEGMENTS)
 
-        for i in range(self.SEEK_SEGMENTS):
-            seg_start = int(dur * i / self.SEEK_SEGMENTS)
-            seg_end = int(dur * (i + 1) / self.SEEK_SEGMENTS)
+        for i, (seg_start, seg_end, idle_label) in enumerate(segments):
             is_current = seg_start <= elapsed < seg_end or (i == self.SEEK_SEGMENTS - 1 and elapsed >= seg_start)
 
             if is_current:
                 label = f"\U0001f518 {format_duration(elapsed)}"
                 style = discord.ButtonStyle.primary
             else:
-                label = f"\u25ac {format_duration(seg_start)}"
+                label = idle_label
                 style = discord.ButtonStyle.secondary
 
-            btn = discord.ui.Button(label=label, style=style, row=1)
-            btn.callback = self._make_seek_cb(seg_start)
+            # Fixed custom_id so an unchanged bar serializes identically between renders
+            btn = discord.ui.Button(label=label, style=style, row=1, custom_id=f"seek:{i}")
+            btn.callback = self._make_seek_cb(seg_start, gq.current)
             self.add_item(btn)
+            self._seek_buttons.append(btn)
 
-    def _rebuild_seek_bar(self) -> None:
+    def _rebuild_seek_bar(self, paused: bool | None = None) -> None:
         """Remove old seek buttons and rebuild with updated position."""
-        # Row 1 buttons are the seek bar — remove them
-        to_remove = [c for c in self.children
-                     if isinstance(c, discord.ui.Button) and c.row == 1]
-        for c in to_remove:
-            self.remove_item(c)
-        self._build_seek_bar()
-
-    def _make_seek_cb(self, secs: int):
+        for btn in self._seek_buttons:
+            self.remove_item(btn)
+        self._seek_buttons.clear()
+        self._build_seek_bar(paused)
+
+    def _position(self, gq: GuildQueue, paused: bool) -> int:
+        """Elapsed seconds to draw; frozen while paused since play_start_time keeps running."""
+        if not paused or gq.current is None:
+            self._paused_at = None
+            return self.cog._get_elapsed(gq)
+        if self._paused_at is None or self._paused_at[0] is not gq.current:
+            self._paused_at = (gq.current, self.cog._get_elapsed(gq))
+        return self._paused_at[1]
+
+    def _make_seek_cb(self, secs: int, track: TrackInfo):
+        # secs is a segment start, always inside the track it was built for
         async def callback(interaction: discord.Interaction) -> None:
             gq = self.cog.queues.get(self.guild.id)
             if err := _check_dj(interaction, gq):
@@ -410,42 +624,48 @@ class PlayerView(discord.ui.View):
             if gq.current is None:
                 await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
                 return
-            target = min(secs, max(0, gq.current.duration - 1)) if gq.current.duration else secs
             await interaction.response.defer()
-            await self.cog._restart_playback(self.guild, seek_seconds=target)
-            await asyncio.sleep(0.5)
+            if gq.current is not track:
+                # Stale bar from the previous track: redraw instead of restarting ffmpeg
+                self._rebuild_seek_bar()
+                self._schedule_update()
+                return
+            await self.cog._restart_playback(self.guild, seek_seconds=secs)
             self._rebuild_seek_bar()
-            await self._update_player()
+            self._schedule_update()
         return callback
 
-    def _build_embed(self) -> discord.Embed:
+    def _build_embed(self, paused: bool | None = None) -> discord.Embed:
         gq = self.cog.queues.get(self.guild.id)
-        vc: Optional[discord.VoiceClient] = self.guild.voice_client  # type: ignore[assignment]
+        if paused is None:
+            paused = self._is_paused()
 
         if gq.current is None:
             return discord.Embed(
                 title="🎵 Nothing Playing",
                 description="Use `/play` to queue a track.",
-                color=discord.Color.dark_grey(),
+                color=_COLOR_DARK_GREY,
             )
 
         track = gq.current
-        elapsed = self.cog._get_elapsed(gq)
+        elapsed = self._position(gq, paused)
+
+        if self._embed_base is None or self._embed_base[0] is not track:
+            url = track.url if track.url and not track.url.startswith("ytsearch:") else None
+            base = discord.Embed(title=track.title, url=url, color=_COLOR_BLURPLE)
+            if track.thumbnail:
+                base.set_thumbnail(url=track.thumbnail)
+            base.add_field(name="👤 Requested by", value=track.requester or "Unknown", inline=True)
+            self._embed_base = (track, base)
 
-        url = track.url if track.url and not track.url.startswith("ytsearch:") else None
-        embed = discord.Embed(title=track.title, url=url, color=discord.Color.blurple())
+        embed = self._embed_base[1].copy()
         bar = progress_bar(elapsed, track.duration)
         embed.description = f"\n{bar}\n"
-
-        if track.thumbnail:
-            embed.set_thumbnail(url=track.thumbnail)
-
-        embed.add_field(name="👤 Requested by", value=track.requester or "Unknown", inline=True)
         embed.add_field(name="🎵 Up next", value=f"{len(gq.queue)} tracks" if gq.queue else "Nothing", inline=True)
         embed.add_field(name="🔊 Volume", value=f"{int(gq.volume * 100)}%", inline=True)
 
         parts: list[str] = []
-        if vc and vc.is_paused():
+        if paused:
             parts.append("⏸️ Paused")
         else:
             parts.append("▶️ Playing")
@@ -464,42 +684,46 @@ class PlayerView(discord.ui.View):
 
         return embed
 
-    def _sync_pause_button(self) -> None:
+    def _is_paused(self) -> bool:
         vc: Optional[discord.VoiceClient] = self.guild.voice_client  # type: ignore[assignment]
-        paused = vc is not None and vc.is_paused()
+        return vc is not None and vc.is_paused()
+
+    def _sync_pause_button(self, paused: bool | None = None) -> None:
+        if paused is None:
+            paused = self._is_paused()
         self.pause_resume_btn.emoji = "\u25b6" if paused else "\u23f8"
         self.pause_resume_btn.style = (
             discord.ButtonStyle.success if paused else discord.ButtonStyle.secondary
         )
 
-    async def _auto_update(self) -> None:
-        try:
-            while not self.is_finished():
-                await asyncio.sleep(10)
-                if self.message is None:
-                    break
-                try:
-                    await self._update_player()
-                except asyncio.CancelledError:
-                    raise
-                except Exception as exc:
-                    log.warning("PlayerView auto-update failed: %s", exc)
-        except asyncio.CancelledError:
-            pass
+    def _schedule_update(self) -> None:
+        """Refresh the message shortly, folding rapid button presses into one edit."""
+        if self._update_handle is None:
+            self._update_handle = self.cog.bot.loop.call_later(self.UPDATE_DELAY, self._fire_update)
+
+    def _fire_update(self) -> None:
+        self._update_handle = None
+        if not self.is_finished():
+            self.cog._spawn(self._update_player())
 
     async def _update_player(self) -> None:
-        embed = self._build_embed()
-        self._sync_pause_button()
-        self._rebuild_seek_bar()
+        paused = self._is_paused()
+        embed = self._build_embed(paused)
+        self._sync_pause_button(paused)
+        self._rebuild_seek_bar(paused)
         if self.message:
+            # Skip the REST call when the message would come out identical
+            render = (embed.to_dict(), self.to_components())
+            if render == self._last_render:
+                return
             try:
                 await self.message.edit(embed=embed, view=self)
             except discord.HTTPException:
-                pass
+                return
+            self._last_render = render
+            self._rendered_paused = paused
 
     async def on_timeout(self) -> None:
-        if self._update_task and not self._update_task.done():
-            self._update_task.cancel()
         for item in self.children:
             item.disabled = True  # type: ignore[union-attr]
         if self.message:
@@ -520,7 +744,7 @@ class PlayerView(discord.ui.View):
             return
         track = gq.previous
         gq.previous = None
-        gq.queue.appendleft(track)
+        gq.push_front(track)
         gq.current = None
         if vc:
             vc.stop()  # _play_next will handle player update via _send_player
@@ -540,8 +764,7 @@ class PlayerView(discord.ui.View):
         seek_to = max(0, elapsed - 10)
         await interaction.response.defer()
         await self.cog._restart_playback(self.guild, seek_seconds=seek_to)
-        await asyncio.sleep(0.5)
-        await self._update_player()
+        self._schedule_update()
 
     @discord.ui.button(emoji="\u23f8", style=discord.ButtonStyle.secondary, row=0)
     async def pause_resume_btn(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
@@ -557,7 +780,7 @@ class PlayerView(discord.ui.View):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
             return
         await interaction.response.defer()
-        await self._update_player()
+        self._schedule_update()
 
     @discord.ui.button(emoji="\u23e9", style=discord.ButtonStyle.secondary, row=0)
     async def forward_btn(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
@@ -576,8 +799,7 @@ class PlayerView(discord.ui.View):
             return
         await interaction.response.defer()
         await self.cog._restart_playback(self.guild, seek_seconds=seek_to)
-        await asyncio.sleep(0.5)
-        await self._update_player()
+        self._schedule_update()
 
     @discord.ui.button(emoji="\u23ed", style=discord.ButtonStyle.secondary, row=0)
     async def next_btn(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
@@ -596,25 +818,21 @@ class PlayerView(discord.ui.View):
 
     @discord.ui.button(emoji="\U0001f509", style=discord.ButtonStyle.secondary, row=2)
     async def vol_down_btn(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
-        gq = self.cog.queues.get(self.guild.id)
-        gq.volume = max(0.0, round(gq.volume - 0.1, 2))
-        vc: Optional[discord.VoiceClient] = self.guild.voice_client  # type: ignore[assignment]
-        if vc and vc.source and isinstance(vc.source, discord.PCMVolumeTransformer):
-            vc.source.volume = gq.volume
-        self.cog.queues.save_settings()
-        await interaction.response.defer()
-        await self._update_player()
+        await self._nudge_volume(interaction, -0.1)
 
     @discord.ui.button(emoji="\U0001f50a", style=discord.ButtonStyle.secondary, row=2)
     async def vol_up_btn(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        await self._nudge_volume(interaction, 0.1)
+
+    async def _nudge_volume(self, interaction: discord.Interaction, delta: float) -> None:
         gq = self.cog.queues.get(self.guild.id)
-        gq.volume = min(1.0, round(gq.volume + 0.1, 2))
-        vc: Optional[discord.VoiceClient] = self.guild.voice_client  # type: ignore[assignment]
-        if vc and vc.source and isinstance(vc.source, discord.PCMVolumeTransformer):
-            vc.source.volume = gq.volume
-        self.cog.queues.save_settings()
+        gq.volume = min(1.0, max(0.0, round(gq.volume + delta, 2)))
+        source = getattr(self.guild.voice_client, "source", None)
+        if isinstance(source, discord.PCMVolumeTransformer):
+            source.volume = gq.volume
+        self.cog._schedule_settings_save(self.guild.id)
         await interaction.response.defer()
-        await self._update_player()
+        self._schedule_update()
 
 
 class QueueView(discord.ui.View):
@@ -630,7 +848,7 @@ class QueueView(discord.ui.View):
 
     @property
     def total_pages(self) -> int:
-        return max(1, math.ceil(len(self.gq.queue) / self.PER_PAGE))
+        return max(1, -(-len(self.gq.queue) // self.PER_PAGE))
 
     def _sync_buttons(self) -> None:
         total = self.total_pages
@@ -640,18 +858,17 @@ class QueueView(discord.ui.View):
 
     def build_embed(self) -> discord.Embed:
         gq = self.gq
-        lines: list[str] = []
-        if gq.current:
-            lines.append(f"▶️  **{gq.current.title}** `{format_duration(gq.current.duration)}`")
-            lines.append("")  # blank separator
-
         start = self.page * self.PER_PAGE
-        end = start + self.PER_PAGE
-        queue_list = list(gq.queue)
-        for i, track in enumerate(queue_list[start:end], start=start):
-            lines.append(f"`{i + 1}.`  {track.title} `{format_duration(track.duration)}`")
+        page_tracks = itertools.islice(gq.queue, start, start + self.PER_PAGE)
+        description = "\n".join(
+            f"`{i}.`  {track.title} `{format_duration(track.duration)}`"
+            for i, track in enumerate(page_tracks, start=start + 1)
+        )
+        if gq.current:
+            # blank line between the now-playing header and the page
+            description = f"▶️  **{gq.current.title}** `{format_duration(gq.current.duration)}`\n\n{description}"
 
-        total_duration = sum(t.duration for t in queue_list) + (gq.current.duration if gq.current else 0)
+        total_duration = gq.total_duration + (gq.current.duration if gq.current else 0)
         loop_emoji = "🔂" if gq.loop_mode.label() == "single track" else "🔁"
         footer_parts = [
             f"🎵 {len(gq.queue)} tracks",
@@ -661,13 +878,12 @@ class QueueView(discord.ui.View):
             f"Page {self.page + 1}/{self.total_pages}",
         ]
 
-        description = "\n".join(lines)
         if len(description) > 4000:
             description = description[:3990] + "\n…"
         embed = discord.Embed(
             title="📋 Queue",
             description=description,
-            color=discord.Color.blurple(),
+            color=_COLOR_BLURPLE,
         )
         embed.set_footer(text="  ·  ".join(footer_parts))
         return embed
@@ -820,7 +1036,7 @@ def _build_help_embed(category_id: str) -> discord.Embed:
             return discord.Embed(
                 title=label,
                 description="\n".join(lines),
-                color=discord.Color.blurple(),
+                color=_COLOR_BLURPLE,
             )
     # Overview
     lines = []
@@ -833,7 +1049,7 @@ def _build_help_embed(category_id: str) -> discord.Embed:
             "Use the menu below to browse commands by category.\n\n"
             + "\n".join(lines)
         ),
-        color=discord.Color.blurple(),
+        color=_COLOR_BLURPLE,
     )
     embed.set_footer(text="Tip: Use /player for an interactive control panel")
     return embed
@@ -866,6 +1082,18 @@ class HelpView(discord.ui.View):
 
 
 class MusicCog(commands.Cog):
+    DM_BLOCK_RETRY = 300  # seconds before retrying a user whose DMs were closed
+    SAVE_DELAY = 0.5  # seconds to coalesce queue-state saves
+    RESTART_DELAY = 0.5  # seconds to coalesce back-to-back /eqcustom restarts
+    PLAYER_REFRESH_INTERVAL = 10  # seconds between player embed refreshes
+    RADIO_BATCH = 10  # recommendations fetched per Spotify call in radio mode
+    YTDL_CACHE_TTL = 86400  # seconds to reuse resolved /play metadata
+    STREAM_INFO_TTL = 3600  # well inside the lifetime of a YouTube stream URL
+    PLAYLIST_WARM = 4  # playlist tracks whose streams are resolved up front
+    LYRICS_CACHE_TTL = 86400  # seconds to reuse an lrclib.net hit
+    SEARCH_CACHE_TTL = 86400  # seconds to reuse /search results
+    MEMBER_QUERY_TIMEOUT = 2.0  # stay well inside the 3s interaction deadline
+
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
         self.queues = QueueManager()
@@ -876,23 +1104,172 @@ class MusicCog(commands.Cog):
         self.ratings = RatingsManager()
         self._active_players: dict[int, PlayerView] = {}
         self._crossfade_timers: dict[int, asyncio.TimerHandle] = {}
+        # guild_id → (upcoming track, task resolving its yt-dlp info)
+        self._prefetches: dict[int, tuple[TrackInfo, asyncio.Task[dict]]] = {}
+        # guild_id → (track, the YTDLSource playing it, also inside a crossfade), for seek restarts
+        self._stream_sources: dict[int, tuple[TrackInfo, YTDLSource]] = {}
+        self._restart_timers: dict[int, asyncio.TimerHandle] = {}
         self._playing_guilds: set[int] = set()  # guilds currently playing audio
+        # guild_id → [(lowercased name, choice)] for playlist autocomplete
+        self._pl_name_cache: dict[int, list[tuple[str, app_commands.Choice[str]]]] = {}
+        # user_id → ((track_url, requester), embed) of the last /grab
+        self._grab_cache: dict[int, tuple[tuple[str, str], discord.Embed]] = {}
+        # user_id → monotonic time their DMs were last found closed
+        self._dm_blocked: dict[int, float] = {}
+        self._save_tasks: dict[int, asyncio.Task] = {}
+        self._background_tasks: set[asyncio.Task] = set()  # fire-and-forget work, see _spawn
+        self._dirty_settings: set[int] = set()
+        self._settings_handle: asyncio.TimerHandle | None = None
+        self._player_ticker_task: asyncio.Task | None = None
+        self._http: aiohttp.ClientSession | None = None  # created in cog_load, kept alive for lyrics
+        # ("video" | "playlist", url) → trimmed yt-dlp metadata for /play
+        self._ytdl_cache = TTLCache(maxsize=512, ttl=self.YTDL_CACHE_TTL)
+        # track url → stream info from the /play lookup, so playback needn't re-extract
+        self._stream_info = TTLCache(maxsize=256, ttl=self.STREAM_INFO_TTL)
+        # normalized "artist title" → lrclib.net hit, trimmed to the fields /lyrics shows
+        self._lyrics_cache = TTLCache(maxsize=512, ttl=self.LYRICS_CACHE_TTL)
+        # (provider, normalized query) → tuple of result tracks for the search picker
+        self._search_cache = TTLCache(maxsize=2048, ttl=self.SEARCH_CACHE_TTL)
+        # Spotify lookups and JSON writes; bounded so a burst of guilds can't spawn a thread each
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="music-io")
+
+    async def cog_load(self) -> None:
+        self._player_ticker_task = asyncio.create_task(self._player_ticker())
+        self._http = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+        )
+
+    async def cog_unload(self) -> None:
+        if self._player_ticker_task:
+            self._player_ticker_task.cancel()
+        if self._settings_handle:
+            self._settings_handle.cancel()
+            self._flush_settings()
+        # Write pending queue saves now rather than losing them with their tasks
+        pending = list(self._save_tasks)
+        for guild_id in pending:
+            self._cancel_save(guild_id)
+            self.queues.save_queue_state(guild_id, write=False)
+        if pending:
+            await self.bot.loop.run_in_executor(self._io_pool, self.queues.write_queue_state)
+        for task in self._background_tasks:
+            task.cancel()
+        self._io_pool.shutdown(wait=False)
+        if self._http:
+            await self._http.close()
 
     # ── helpers ──────────────────────────────────────────────────────────
 
+    async def _player_ticker(self) -> None:
+        """Refresh every active PlayerView on one shared clock instead of a task per guild."""
+        while True:
+            await asyncio.sleep(self.PLAYER_REFRESH_INTERVAL)
+            views = [
+                v for v in self._active_players.values()
+                if v.message and not v.is_finished()
+                # a player already rendered as paused has nothing new to show
+                and not (v._rendered_paused and v._is_paused())
+            ]
+            if not views:
+                continue
+            results = await asyncio.gather(*(v._update_player() for v in views), return_exceptions=True)
+            for res in results:
+                if isinstance(res, Exception):
+                    log.warning("PlayerView auto-update failed: %s", res)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run *coro* in the background, holding a reference until it ends and logging failures."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_done)
+        return task
+
+    def _background_done(self, task: asyncio.Task) -> None:
+        self._background_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            log.warning("Background task failed: %s", exc, exc_info=exc)
+
+    def _schedule_save(self, guild_id: int) -> None:
+        """Queue a debounced queue-state save; bursts of changes produce one write."""
+        if guild_id not in self._save_tasks:
+            self._save_tasks[guild_id] = self._spawn(self._flush_save(guild_id))
+
+    def _cancel_save(self, guild_id: int) -> None:
+        task = self._save_tasks.pop(guild_id, None)
+        if task:
+            task.cancel()
+
+    def mark_settings_dirty(self, guild_id: int) -> None:
+        """Persist a guild's settings after an outside change (e.g. from the web dashboard)."""
+        self._schedule_settings_save(guild_id)
+
+    def _schedule_settings_save(self, guild_id: int) -> None:
+        """Mark a guild's settings dirty and write them once changes stop for SAVE_DELAY."""
+        self._dirty_settings.add(guild_id)
+        if self._settings_handle:
+            self._settings_handle.cancel()
+        self._settings_handle = self.bot.loop.call_later(self.SAVE_DELAY, self._flush_settings)
+
+    def _flush_settings(self) -> None:
+        self._settings_handle = None
+        for guild_id in self._dirty_settings:
+            self.queues.save_settings(guild_id, write=False)
+        self._dirty_settings.clear()
+        fut = self.bot.loop.run_in_executor(self._io_pool, self.queues.write_settings)
+        fut.add_done_callback(_log_write_error)
+
+    async def _flush_save(self, guild_id: int) -> None:
+        try:
+            await asyncio.sleep(self.SAVE_DELAY)
+        finally:
+            if self._save_tasks.get(guild_id) is asyncio.current_task():
+                del self._save_tasks[guild_id]
+        # Snapshot on the loop so the worker thread never sees a queue mid-change
+        if self.queues.save_queue_state(guild_id, write=False):
+            await self.bot.loop.run_in_executor(self._io_pool, self.queues.write_queue_state)
+
     def _cleanup_player(self, guild_id: int) -> None:
         """Stop and remove the active PlayerView for a guild."""
         old = self._active_players.pop(guild_id, None)
         if old:
-            if old._update_task and not old._update_task.done():
-                old._update_task.cancel()
             old.stop()
 
     def _get_elapsed(self, gq: GuildQueue) -> int:
         """Get elapsed playback time in seconds, accounting for speed."""
         if not gq.play_start_time:
             return 0
-        return int((time.time() - gq.play_start_time) * gq.speed)
+        return int((time.monotonic() - gq.play_start_time) * gq.speed)
+
+    async def _resolve_members(
+        self, guild: discord.Guild, user_ids: list[int]
+    ) -> dict[int, discord.Member]:
+        """Look up members by ID, fetching cache misses in a single gateway request.
+
+        The bot runs without the members intent, so the member cache is often
+        cold; unresolved IDs are simply absent from the result.
+        """
+        found: dict[int, discord.Member] = {}
+        missing: list[int] = []
+        for uid in dict.fromkeys(user_ids):
+            member = guild.get_member(uid)
+            if member:
+                found[uid] = member
+            else:
+                missing.append(uid)
+        if missing:
+            # The gateway accepts at most 100 ids per request; limit defaults to 5
+            batch = missing[:100]
+            try:
+                fetched = await asyncio.wait_for(
+                    guild.query_members(user_ids=batch, limit=len(batch), cache=True),
+                    timeout=self.MEMBER_QUERY_TIMEOUT,
+                )
+            except (asyncio.TimeoutError, discord.ClientException) as exc:
+                log.debug("Member query failed in guild %s: %s", guild.id, exc)
+            else:
+                found.update((m.id, m) for m in fetched)
+        return found
 
     async def _ensure_voice(
         self, interaction: discord.Interaction
@@ -924,6 +1301,9 @@ class MusicCog(commands.Cog):
         vc: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[assignment]
         if vc and not vc.is_playing() and not vc.is_paused():
             self._cancel_crossfade_timer(guild.id)
+            self._cancel_restart(guild.id)
+            self._cancel_prefetch(guild.id)
+            self._stream_sources.pop(guild.id, None)
             self._cleanup_player(guild.id)
             asyncio.run_coroutine_threadsafe(vc.disconnect(), self.bot.loop)
             self.queues.clear_queue_state(guild.id)
@@ -951,7 +1331,13 @@ class MusicCog(commands.Cog):
                 except discord.HTTPException:
                     pass
 
-    async def _play_next(self, guild: discord.Guild, _fail_count: int = 0) -> None:
+    async def _play_next(
+        self,
+        guild: discord.Guild,
+        _fail_count: int = 0,
+        *,
+        prepared: tuple[TrackInfo, YTDLSource] | None = None,
+    ) -> None:
         gq = self.queues.get(guild.id)
         vc: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[assignment]
         if vc is None:
@@ -963,38 +1349,44 @@ class MusicCog(commands.Cog):
             return
 
         track = gq.next_track()
+        source: YTDLSource | None = None
+        if prepared is not None:
+            if prepared[0] is track:
+                source = prepared[1]
+            else:
+                prepared[1].cleanup()
         if track is None:
             # Radio mode: continuously queue similar tracks
             if gq.radio_mode and self.spotify.available and gq.radio_seed:
-                try:
-                    results = await self.bot.loop.run_in_executor(
-                        None,
-                        lambda: self.spotify.recommend_by_seed(
-                            gq.radio_seed, gq.radio_history, 1  # type: ignore[arg-type]
-                        ),
-                    )
-                    if results:
-                        tid, rec = results[0]
-                        gq.radio_history.add(tid)
-                        # Keep history bounded; if it grows too large, drop the oldest
-                        # half so Spotify has more tracks to recommend from
-                        if len(gq.radio_history) > 200:
-                            items = list(gq.radio_history)
-                            gq.radio_history = set(items[100:])
-                        gq.add(rec)
-                        track = gq.next_track()
-                        await self._notify_text_channel(
-                            guild, f"Radio: queued **{rec.title}**"
-                        )
-                except Exception as exc:
-                    log.warning("Radio recommendation failed: %s", exc)
+                if gq.radio_lock.locked():
+                    return  # another _play_next is already fetching the next radio track
+                async with gq.radio_lock:
+                    try:
+                        if not gq.radio_buffer:
+                            results = await self.bot.loop.run_in_executor(
+                                self._io_pool,
+                                lambda: self.spotify.recommend_by_seed(
+                                    gq.radio_seed, gq.radio_history, self.RADIO_BATCH  # type: ignore[arg-type]
+                                ),
+                            )
+                            gq.radio_buffer.extend(results)
+                            gq.radio_history.update(tid for tid, _ in results)
+                        if gq.radio_buffer:
+                            _, rec = gq.radio_buffer.popleft()
+                            gq.add(rec)
+                            track = gq.next_track()
+                            await self._notify_text_channel(
+                                guild, f"Radio: queued **{rec.title}**"
+                            )
+                    except Exception as exc:
+                        log.warning("Radio recommendation failed: %s", exc)
 
             # Autoplay: recommend a track based on what just played
             # Use gq.previous — next_track() already moved current → previous
             if track is None and gq.autoplay and self.spotify.available and gq.previous is not None:
                 try:
                     rec = await self.bot.loop.run_in_executor(
-                        None, self.spotify.recommend, gq.previous.title
+                        self._io_pool, self.spotify.recommend, gq.previous.title
                     )
                     if rec:
                         gq.add(rec)
@@ -1009,20 +1401,15 @@ class MusicCog(commands.Cog):
                 if guild.id in self._playing_guilds:
                     self._playing_guilds.discard(guild.id)
                     metric_active_players.dec()
-                self.queues.save_queue_state(guild.id)
+                self._schedule_save(guild.id)
                 await self._update_presence(None)
                 if not gq.stay_connected:
                     self.bot.loop.call_later(300, self._check_idle, guild)
                 return
 
         try:
-            source = await YTDLSource.from_query(
-                track.url, loop=self.bot.loop, volume=gq.volume,
-                filter_name=gq.filter_name,
-                speed=gq.speed, normalize=gq.normalize,
-                eq_bands=gq.eq_bands if any(g != 0 for g in gq.eq_bands) else None,
-                is_live=track.is_live,
-            )
+            if source is None:
+                source = await self._make_source(guild.id, track)
         except Exception as exc:
             log.error("Failed to create source for %s: %s", track.title, exc)
             playback_errors_total.inc()
@@ -1042,16 +1429,23 @@ class MusicCog(commands.Cog):
             self._playing_guilds.add(guild.id)
             metric_active_players.inc()
         metric_queue_size.labels(guild_id=str(guild.id)).set(len(gq.queue))
-        gq.play_start_time = time.time()
+        gq.play_start_time = time.monotonic()
         self.history.record(
             guild.id, track,
             requester_id=track.requester_id,
             duration=track.duration,
+            write=False,
         )
-        self.queues.save_queue_state(guild.id)
-        vc.play(source, after=lambda e: self._after_play(guild, e))
+        self.bot.loop.run_in_executor(self._io_pool, self.history.write).add_done_callback(_log_write_error)
+        self._schedule_save(guild.id)
+        vc.play(source, after=functools.partial(self._after_play, guild))
+        self._stream_sources[guild.id] = (track, source)
+        self._prefetch_next(guild.id, gq)
         await self._update_presence(track)
 
+        # A new track already starts with the current settings
+        self._cancel_restart(guild.id)
+
         # Schedule crossfade if enabled and track has known duration
         self._cancel_crossfade_timer(guild.id)
         if (
@@ -1061,10 +1455,9 @@ class MusicCog(commands.Cog):
             and gq.queue
         ):
             delay = max(0, (track.duration / gq.speed) - gq.crossfade_seconds)
-            handle = self.bot.loop.call_later(
-                delay, lambda: asyncio.ensure_future(self._start_crossfade(guild))
+            self._crossfade_timers[guild.id] = self.bot.loop.call_later(
+                delay, self._fire_crossfade, guild
             )
-            self._crossfade_timers[guild.id] = handle
 
         # Auto-send/refresh the player view in the text channel
         await self._send_player(guild, gq)
@@ -1077,8 +1470,6 @@ class MusicCog(commands.Cog):
         # Clean up the old player
         old = self._active_players.pop(guild.id, None)
         if old:
-            if old._update_task and not old._update_task.done():
-                old._update_task.cancel()
             old.stop()
 
         if gq.current is None or gq.text_channel_id is None:
@@ -1100,8 +1491,9 @@ class MusicCog(commands.Cog):
 
         view = PlayerView(self, guild)
         self._active_players[guild.id] = view
-        embed = view._build_embed()
-        view._sync_pause_button()
+        paused = view._is_paused()
+        embed = view._build_embed(paused)
+        view._sync_pause_button(paused)
 
         # Always delete old message and send a new one at the bottom
         if old and old.message:
@@ -1113,7 +1505,6 @@ class MusicCog(commands.Cog):
         try:
             msg = await channel.send(embed=embed, view=view, silent=True)  # type: ignore[union-attr]
             view.message = msg
-            view._update_task = asyncio.create_task(view._auto_update())
         except discord.HTTPException:
             self._active_players.pop(guild.id, None)
 
@@ -1129,7 +1520,7 @@ class MusicCog(commands.Cog):
         embed = discord.Embed(
             title=track.title,
             url=track.url if track.url.startswith("http") else None,
-            color=discord.Color.blurple(),
+            color=_COLOR_BLURPLE,
         )
         if track.thumbnail:
             embed.set_thumbnail(url=track.thumbnail)
@@ -1165,11 +1556,92 @@ class MusicCog(commands.Cog):
             activity = None
         await self.bot.change_presence(activity=activity)
 
+    async def _make_source(self, guild_id: int, track: TrackInfo) -> YTDLSource:
+        """Resolve *track* into a playable source with the guild's current audio settings."""
+        gq = self.queues.get(guild_id)
+        data: dict | None = None
+        pending = self._prefetches.pop(guild_id, None)
+        if pending is not None:
+            if pending[0] is track:
+                try:
+                    data = await pending[1]
+                except Exception as exc:
+                    log.debug("Prefetch for %s failed, resolving again: %s", track.title, exc)
+            else:
+                pending[1].cancel()
+        if data is None:
+            data = self._stream_info.get(track.url)
+        if data is None:
+            data = await YTDLSource.extract(track.url, loop=self.bot.loop)
+        return YTDLSource.from_stream_url(
+            data["url"], data=data, volume=gq.volume,
+            filter_name=gq.filter_name,
+            speed=gq.speed, normalize=gq.normalize,
+            eq_bands=gq.eq_bands if gq.eq_active else None,
+            is_live=track.is_live,
+        )
+
+    async def _warm_streams(self, tracks: list[TrackInfo]) -> None:
+        """Resolve stream info for several queued tracks in parallel."""
+        async def resolve(track: TrackInfo) -> None:
+            raw = await self.bot.loop.run_in_executor(None, ytdl_extract, track.url)
+            stream = _trim_stream_info(raw)
+            if stream is not None:
+                self._stream_info.put(track.url, stream)
+
+        await asyncio.gather(
+            *(resolve(t) for t in tracks if self._stream_info.get(t.url) is None),
+            return_exceptions=True,
+        )
+
+    def _prefetch_next(self, guild_id: int, gq: GuildQueue) -> None:
+        """Start resolving the upcoming track's stream while the current one plays."""
+        self._cancel_prefetch(guild_id)
+        if not gq.queue or gq.loop_mode == LoopMode.SINGLE:
+            return
+        track = gq.queue[0]
+        if self._stream_info.get(track.url) is not None:
+            return
+        task = asyncio.create_task(YTDLSource.extract(track.url, loop=self.bot.loop))
+        # Failures surface again when the track is resolved for real
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._prefetches[guild_id] = (track, task)
+
+    def _cancel_prefetch(self, guild_id: int) -> None:
+        pending = self._prefetches.pop(guild_id, None)
+        if pending:
+            pending[1].cancel()
+
+    async def _swap_track(self, guild: discord.Guild, track: TrackInfo) -> None:
+        """Cut to *track* now, resolving it while the current track keeps playing."""
+        gq = self.queues.get(guild.id)
+        try:
+            source: YTDLSource | None = await self._make_source(guild.id, track)
+        except Exception as exc:
+            log.warning("Swap pre-fetch failed for %s: %s", track.title, exc)
+            source = None  # _play_next retries and reports the failure
+
+        vc: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[assignment]
+        if vc is None:
+            if source is not None:
+                source.cleanup()
+            return
+
+        gq.push_front(track)
+        gq._restarting = True
+        vc.stop()
+        gq._restarting = False
+        await self._play_next(guild, prepared=(track, source) if source else None)
+
     def _cancel_crossfade_timer(self, guild_id: int) -> None:
         handle = self._crossfade_timers.pop(guild_id, None)
         if handle:
             handle.cancel()
 
+    def _fire_crossfade(self, guild: discord.Guild) -> None:
+        self._crossfade_timers.pop(guild.id, None)
+        self._spawn(self._start_crossfade(guild))
+
     async def _start_crossfade(self, guild: discord.Guild) -> None:
         """Begin crossfade from current track to next."""
         gq = self.queues.get(guild.id)
@@ -1179,13 +1651,7 @@ class MusicCog(commands.Cog):
 
         next_track = gq.queue[0]
         try:
-            incoming = await YTDLSource.from_query(
-                next_track.url, loop=self.bot.loop, volume=gq.volume,
-                filter_name=gq.filter_name,
-                speed=gq.speed, normalize=gq.normalize,
-                eq_bands=gq.eq_bands if any(g != 0 for g in gq.eq_bands) else None,
-                is_live=next_track.is_live,
-            )
+            incoming = await self._make_source(guild.id, next_track)
         except Exception as exc:
             log.warning("Crossfade pre-fetch failed: %s", exc)
             return
@@ -1214,54 +1680,79 @@ class MusicCog(commands.Cog):
 
         # Advance queue
         gq.previous = gq.current
-        gq.current = gq.queue.popleft()
+        gq.current = gq.pop_front()
         gq.skip_votes.clear()
-        gq.play_start_time = time.time()
+        gq.play_start_time = time.monotonic()
         self.history.record(
             guild.id, gq.current,
             requester_id=gq.current.requester_id,
             duration=gq.current.duration,
+            write=False,
         )
-        self.queues.save_queue_state(guild.id)
+        self.bot.loop.run_in_executor(self._io_pool, self.history.write).add_done_callback(_log_write_error)
+        self._schedule_save(guild.id)
 
-        vc.play(xfade_vol, after=lambda e: self._after_play(guild, e))
+        vc.play(xfade_vol, after=functools.partial(self._after_play, guild))
+        self._stream_sources[guild.id] = (gq.current, incoming)
         gq._restarting = False
+        self._prefetch_next(guild.id, gq)
         await self._update_presence(gq.current)
 
         # Schedule next crossfade
         if gq.crossfade_seconds > 0 and gq.current.duration > 0 and gq.queue:
             delay = max(0, (gq.current.duration / gq.speed) - gq.crossfade_seconds)
-            handle = self.bot.loop.call_later(
-                delay, lambda: asyncio.ensure_future(self._start_crossfade(guild))
+            self._crossfade_timers[guild.id] = self.bot.loop.call_later(
+                delay, self._fire_crossfade, guild
             )
-            self._crossfade_timers[guild.id] = handle
+
+    def _schedule_restart(self, guild: discord.Guild) -> None:
+        """Restart playback at the live position after RESTART_DELAY, resetting the delay on each call."""
+        self._cancel_restart(guild.id)
+        self._restart_timers[guild.id] = self.bot.loop.call_later(
+            self.RESTART_DELAY, self._fire_restart, guild, self.queues.get(guild.id).current
+        )
+
+    def _cancel_restart(self, guild_id: int) -> None:
+        handle = self._restart_timers.pop(guild_id, None)
+        if handle:
+            handle.cancel()
+
+    def _fire_restart(self, guild: discord.Guild, track: TrackInfo | None) -> None:
+        self._restart_timers.pop(guild.id, None)
+        vc: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[assignment]
+        if vc is None or not (vc.is_playing() or vc.is_paused()):
+            return  # between tracks: _play_next is about to start one with the new settings
+        gq = self.queues.get(guild.id)
+        if gq.current is not track:
+            return  # the track the change was made for has already ended
+        elapsed = self._get_elapsed(gq)
+        self._spawn(self._restart_playback(guild, seek_seconds=elapsed))
 
     async def _restart_playback(
         self, guild: discord.Guild, seek_seconds: int = 0
     ) -> None:
         """Restart current track with the active filter and/or seek position."""
+        self._cancel_restart(guild.id)  # this restart picks up any pending setting change
         gq = self.queues.get(guild.id)
         vc: Optional[discord.VoiceClient] = guild.voice_client  # type: ignore[assignment]
         if vc is None or gq.current is None:
             return
 
-        eq = gq.eq_bands if any(g != 0 for g in gq.eq_bands) else None
+        eq = gq.eq_bands if gq.eq_active else None
         is_live = gq.current.is_live
 
-        # Get the stream URL from the current source if available
-        current_source = vc.source
-        stream_url = None
-        if isinstance(current_source, YTDLSource):
-            stream_url = current_source.stream_url
-            data = current_source._data
+        # Reuse the stream URL of the source now playing, even when it is wrapped in a crossfade,
+        # but only while it belongs to the current track and not one _play_next is moving past
+        entry = self._stream_sources.get(guild.id)
+        current_source = entry[1] if entry is not None and entry[0] is gq.current else None
 
         gq._restarting = True
         vc.stop()
 
-        if stream_url:
+        if current_source is not None and current_source.stream_url:
             source = YTDLSource.from_stream_url(
-                stream_url,
-                data=data,
+                current_source.stream_url,
+                data=current_source._data,
                 volume=gq.volume,
                 filter_name=gq.filter_name,
                 seek_seconds=seek_seconds,
@@ -1283,8 +1774,9 @@ class MusicCog(commands.Cog):
                 is_live=is_live,
             )
 
-        gq.play_start_time = time.time() - (seek_seconds / gq.speed)
-        vc.play(source, after=lambda e: self._after_play(guild, e))
+        gq.play_start_time = time.monotonic() - (seek_seconds / gq.speed)
+        vc.play(source, after=functools.partial(self._after_play, guild))
+        self._stream_sources[guild.id] = (gq.current, source)
         gq._restarting = False
 
     async def _enqueue_and_play(
@@ -1325,11 +1817,7 @@ class MusicCog(commands.Cog):
 
         # Per-user queue limit
         if gq.max_per_user > 0:
-            user_count = sum(
-                1 for t in gq.queue
-                if t.requester_id == interaction.user.id
-                or (t.requester_id == 0 and t.requester == interaction.user.display_name)
-            )
+            user_count = gq.per_user_count(interaction.user.id, interaction.user.display_name)
             if user_count >= gq.max_per_user:
                 s = "s" if user_count != 1 else ""
                 msg = (
@@ -1351,8 +1839,8 @@ class MusicCog(commands.Cog):
                 else:
                     await interaction.response.send_message(msg, ephemeral=True)
                 return
-            gq.queue.appendleft(track)
-            self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+            gq.push_front(track)
+            self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
             msg = f"⏭️ **{track.title}** will play next."
             if interaction.response.is_done():
                 await interaction.followup.send(msg)
@@ -1363,7 +1851,7 @@ class MusicCog(commands.Cog):
         # Duplicate detection
         is_dup = gq.has_duplicate(track)
         pos = gq.add(track)
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
 
         if pos is None:
             msg = f"Queue is full ({gq.max_queue} tracks max)."
@@ -1388,30 +1876,43 @@ class MusicCog(commands.Cog):
         else:
             await interaction.response.send_message(msg)
 
+    async def _fetch_flat_playlist(self, url: str, profile: str) -> dict:
+        """Flat-extract a playlist with the given yt-dlp profile, cached per URL."""
+        data = self._ytdl_cache.get(("playlist", url))
+        if data is None:
+            raw = await self.bot.loop.run_in_executor(None, ytdl_extract, url, profile)
+            data = _trim_playlist_info(raw)
+            if data["entries"]:
+                self._ytdl_cache.put(("playlist", url), data)
+        return data
+
     async def _play_youtube_playlist(
         self, interaction: discord.Interaction, url: str
     ) -> None:
         """Fetch a YouTube playlist and queue all its tracks."""
         try:
-            import yt_dlp
-            from music.audio_source import YTDL_OPTIONS
-
-            ytdl = yt_dlp.YoutubeDL(
-                {
-                    **YTDL_OPTIONS,
-                    "noplaylist": False,
-                    "extract_flat": "in_playlist",
-                    "extractor_args": {"youtubetab": {"skip": ["authcheck"]}},
-                }
-            )
-            data = await self.bot.loop.run_in_executor(
-                None, lambda: ytdl.extract_info(url, download=False)
-            )
+            data = await self._fetch_flat_playlist(url, "playlist")
+        except Exception as exc:
+            await interaction.followup.send(f"Could not load playlist: {exc}")
+            return
+        await self._ingest_flat_entries(interaction, data, "YouTube playlist")
+
+    async def _play_soundcloud_playlist(
+        self, interaction: discord.Interaction, url: str
+    ) -> None:
+        """Fetch a SoundCloud set and queue all its tracks."""
+        try:
+            data = await self._fetch_flat_playlist(url, "soundcloud")
         except Exception as exc:
             await interaction.followup.send(f"Could not load playlist: {exc}")
             return
+        await self._ingest_flat_entries(interaction, data, "SoundCloud playlist")
 
-        entries = data.get("entries") or []
+    async def _ingest_flat_entries(
+        self, interaction: discord.Interaction, data: dict, default_title: str
+    ) -> None:
+        """Queue the entries of a flat-extracted playlist and report the result."""
+        entries = data["entries"]
         if not entries:
             await interaction.followup.send("❌ No tracks found in that playlist.")
             return
@@ -1422,59 +1923,43 @@ class MusicCog(commands.Cog):
 
         gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
         gq.text_channel_id = interaction.channel_id
-        total_entries = sum(1 for e in entries if e is not None)
+        total_entries = len(entries)
         progress_msg = None
         if total_entries > 5:
             progress_msg = await interaction.followup.send(
-                f"Loading... (0/{total_entries} queued)", wait=True
+                f"Loading {total_entries} tracks...", wait=True
             )
 
-        count = 0
-        skipped = 0
-        skip_reason = "queue full"
         user_id = interaction.user.id
         user_name = interaction.user.display_name
-        user_queued = sum(
-            1 for t in gq.queue
-            if t.requester_id == user_id or (t.requester_id == 0 and t.requester == user_name)
-        )
-        for entry in entries:
-            if entry is None:
-                continue
-            if gq.max_per_user > 0 and user_queued >= gq.max_per_user:
-                skipped = total_entries - count
-                skip_reason = f"per-user limit of {gq.max_per_user}"
-                break
-            entry_url = entry.get("webpage_url") or entry.get("url", "")
-            if not entry_url:
-                video_id = entry.get("id", "")
-                if video_id:
-                    entry_url = f"https://www.youtube.com/watch?v={video_id}"
-            track = TrackInfo(
+        # Only build tracks that can actually be queued
+        take, skip_reason = gq.room_for(user_id, user_name, total_entries)
+        tracks = [
+            TrackInfo(
                 title=entry.get("title", "Unknown"),
-                url=entry_url,
+                url=_playlist_entry_url(entry),
                 duration=int(entry.get("duration", 0) or 0),
                 thumbnail=entry.get("thumbnail", ""),
                 requester=user_name,
                 requester_id=user_id,
             )
-            if gq.add(track) is None:
-                skipped = total_entries - count
-                break
-            count += 1
-            user_queued += 1
-            if progress_msg and count % 5 == 0:
-                try:
-                    await progress_msg.edit(content=f"Loading... ({count}/{total_entries} queued)")
-                except discord.HTTPException:
-                    pass
+            for entry in itertools.islice(entries, take)
+        ]
+
+        count = gq.extend(tracks)
+        skipped = total_entries - count
+        warm = tracks[:min(count, self.PLAYLIST_WARM)]
 
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
 
         if not vc.is_playing() and not vc.is_paused():
             await self._play_next(interaction.guild)  # type: ignore[arg-type]
+            # The first track is playing and the next is being prefetched; warm the ones after
+            warm = list(itertools.islice(gq.queue, 1, 1 + self.PLAYLIST_WARM))
+        if warm:
+            self._spawn(self._warm_streams(warm))
 
-        playlist_title = data.get("title", "YouTube playlist")
+        playlist_title = data.get("title") or default_title
         msg = f"Queued **{count} tracks** from **{playlist_title}**."
         if skipped:
             msg += f" ({skipped} skipped — {skip_reason})"
@@ -1491,15 +1976,15 @@ class MusicCog(commands.Cog):
     ) -> None:
         """Resolve a single YouTube URL or search query and queue it."""
         try:
-            import yt_dlp
-            from music.audio_source import YTDL_OPTIONS
-
-            ytdl = yt_dlp.YoutubeDL({**YTDL_OPTIONS, "skip_download": True})
-            data = await self.bot.loop.run_in_executor(
-                None, lambda: ytdl.extract_info(url, download=False)
-            )
-            if "entries" in data:
-                data = data["entries"][0]
+            data = self._ytdl_cache.get(("video", url))
+            if data is None:
+                raw = await self.bot.loop.run_in_executor(None, ytdl_extract, url)
+                data = _trim_video_info(raw)
+                self._ytdl_cache.put(("video", url), data)
+                # The same extraction already picked a stream; keep it for playback
+                stream = _trim_stream_info(raw)
+                if stream is not None:
+                    self._stream_info.put(data.get("webpage_url", url), stream)
 
             track = TrackInfo(
                 title=data.get("title", "Unknown"),
@@ -1544,7 +2029,7 @@ class MusicCog(commands.Cog):
             }
             try:
                 search_strings = await self.bot.loop.run_in_executor(
-                    None, resolver_map[input_type], value
+                    self._io_pool, resolver_map[input_type], value
                 )
             except Exception as exc:
                 await interaction.followup.send(f"Spotify error: {exc}")
@@ -1564,38 +2049,18 @@ class MusicCog(commands.Cog):
             progress_msg = None
             if total > 5:
                 progress_msg = await interaction.followup.send(
-                    f"Loading... (0/{total} queued)", wait=True
+                    f"Loading {total} tracks...", wait=True
                 )
 
-            count = 0
-            sp_skip_reason = "queue full"
             sp_user_id = interaction.user.id
             sp_user_name = interaction.user.display_name
-            sp_user_queued = sum(
-                1 for t in gq.queue
-                if t.requester_id == sp_user_id or (t.requester_id == 0 and t.requester == sp_user_name)
+            take, sp_skip_reason = gq.room_for(sp_user_id, sp_user_name, total)
+            count = gq.extend(
+                TrackInfo(title=q, url=f"ytsearch:{q}", requester=sp_user_name, requester_id=sp_user_id)
+                for q in itertools.islice(search_strings, take)
             )
-            for s in search_strings:
-                if gq.max_per_user > 0 and sp_user_queued >= gq.max_per_user:
-                    sp_skip_reason = f"per-user limit of {gq.max_per_user}"
-                    break
-                track = TrackInfo(
-                    title=s,
-                    url=f"ytsearch:{s}",
-                    requester=sp_user_name,
-                    requester_id=sp_user_id,
-                )
-                if gq.add(track) is None:
-                    break
-                count += 1
-                sp_user_queued += 1
-                if progress_msg and count % 5 == 0:
-                    try:
-                        await progress_msg.edit(content=f"Loading... ({count}/{total} queued)")
-                    except discord.HTTPException:
-                        pass
 
-            self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+            self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
 
             if not vc.is_playing() and not vc.is_paused():
                 await self._play_next(interaction.guild)  # type: ignore[arg-type]
@@ -1615,9 +2080,7 @@ class MusicCog(commands.Cog):
         # YouTube playlist
         if input_type == InputType.YOUTUBE_PLAYLIST:
             # Detect YouTube Mix (list=RD...) — these are personalized
-            params = parse_qs(urlparse(value).query)
-            list_id = params.get("list", [""])[0]
-            if list_id.startswith("RD"):
+            if _MIX_RE.search(value):
                 await interaction.response.send_message(
                     "This is a **YouTube Mix** — its contents are personalized and "
                     "may differ from what you see in your browser.\n"
@@ -1652,7 +2115,7 @@ class MusicCog(commands.Cog):
 
         if input_type == InputType.SOUNDCLOUD_PLAYLIST:
             await interaction.response.defer()
-            await self._play_youtube_playlist(interaction, value)
+            await self._play_soundcloud_playlist(interaction, value)
             return
 
         # YouTube URL or search
@@ -1693,7 +2156,7 @@ class MusicCog(commands.Cog):
                 return
             try:
                 search_strings = await self.bot.loop.run_in_executor(
-                    None, self.spotify.resolve_track, value
+                    self._io_pool, self.spotify.resolve_track, value
                 )
             except Exception as exc:
                 await interaction.followup.send(f"Spotify error: {exc}")
@@ -1708,19 +2171,19 @@ class MusicCog(commands.Cog):
         await self._play_single_url(interaction, value, play_next=True)
 
     @app_commands.command(name="stop", description="Stop playback, clear queue, and disconnect")
-    async def stop(self, interaction: discord.Interaction) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def stop(self, interaction: discord.Interaction, gq: GuildQueue) -> None:
         vc: Optional[discord.VoiceClient] = interaction.guild.voice_client  # type: ignore[union-attr, assignment]
         if vc is None:
             await interaction.response.send_message("Not connected.", ephemeral=True)
             return
 
         gq.clear()
+        self._cancel_save(interaction.guild.id)  # type: ignore[union-attr]
         self.queues.clear_queue_state(interaction.guild.id)  # type: ignore[union-attr]
         self._cancel_crossfade_timer(interaction.guild.id)  # type: ignore[union-attr]
+        self._cancel_prefetch(interaction.guild.id)  # type: ignore[union-attr]
+        self._stream_sources.pop(interaction.guild.id, None)  # type: ignore[union-attr]
         self._cleanup_player(interaction.guild.id)  # type: ignore[union-attr]
         vc.stop()
         await vc.disconnect()
@@ -1733,11 +2196,8 @@ class MusicCog(commands.Cog):
         await interaction.response.send_message("⏹️ Stopped and disconnected.")
 
     @app_commands.command(name="skip", description="Skip the current track and play the next one in the queue")
-    async def skip(self, interaction: discord.Interaction) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def skip(self, interaction: discord.Interaction, gq: GuildQueue) -> None:
         vc: Optional[discord.VoiceClient] = interaction.guild.voice_client  # type: ignore[union-attr, assignment]
         if vc is None or (not vc.is_playing() and not vc.is_paused()):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
@@ -1772,7 +2232,7 @@ class MusicCog(commands.Cog):
             embed = discord.Embed(
                 title="Queue",
                 description="\n".join(lines),
-                color=discord.Color.blurple(),
+                color=_COLOR_BLURPLE,
             )
             await interaction.response.send_message(embed=embed)
 
@@ -1797,7 +2257,7 @@ class MusicCog(commands.Cog):
         embed = discord.Embed(
             title=f"📋 Your tracks — {interaction.user.display_name}",
             description="\n".join(lines),
-            color=discord.Color.blurple(),
+            color=_COLOR_BLURPLE,
         )
         embed.set_footer(text=f"{len(my_tracks)} track{s} in queue")
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -1835,7 +2295,7 @@ class MusicCog(commands.Cog):
         embed = discord.Embed(
             title="Now Playing",
             description=f"**{track.title}**\n{progress_bar(elapsed, track.duration)}",
-            color=discord.Color.blurple(),
+            color=_COLOR_BLURPLE,
         )
         embed.add_field(name="👤 Requested by", value=track.requester or "Unknown", inline=True)
         loop_emoji = "🔂" if gq.loop_mode.label() == "single track" else "🔁"
@@ -1869,11 +2329,8 @@ class MusicCog(commands.Cog):
 
     @app_commands.command(name="volume", description="Adjust volume (1-100)")
     @app_commands.describe(level="Volume level from 1 to 100")
-    async def volume(self, interaction: discord.Interaction, level: int) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def volume(self, interaction: discord.Interaction, gq: GuildQueue, level: int) -> None:
         if not 1 <= level <= 100:
             await interaction.response.send_message(
                 "Volume must be between 1 and 100.", ephemeral=True
@@ -1886,11 +2343,28 @@ class MusicCog(commands.Cog):
         if vc and vc.source and isinstance(vc.source, discord.PCMVolumeTransformer):
             vc.source.volume = gq.volume
 
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(f"🔊 Volume set to **{level}%**.")
 
+    async def _cached_search(self, provider: str, query: str, fetch) -> list[TrackInfo]:
+        """Run a picker search through the search cache.
+
+        Only non-empty results are stored, and callers get fresh copies since
+        SearchView stamps the requester onto the chosen track.
+        """
+        key = (provider, " ".join(query.casefold().split()))
+        cached = self._search_cache.get(key)
+        if cached is None:
+            results = await fetch()
+            if results:
+                self._search_cache.put(key, tuple(replace(t) for t in results))
+            return results
+        return [replace(t) for t in cached]
+
     async def _do_youtube_search(self, interaction: discord.Interaction, query: str) -> None:
-        results = await YTDLSource.search(query, loop=self.bot.loop, limit=5)
+        results = await self._cached_search(
+            "youtube", query, lambda: YTDLSource.search(query, loop=self.bot.loop, limit=5)
+        )
         if not results:
             await interaction.followup.send("No results found.")
             return
@@ -1914,8 +2388,9 @@ class MusicCog(commands.Cog):
             )
             return
 
-        results = await self.bot.loop.run_in_executor(
-            None, lambda: self.spotify.search(query, limit=5)
+        results = await self._cached_search(
+            "spotify", query,
+            lambda: self.bot.loop.run_in_executor(self._io_pool, lambda: self.spotify.search(query, limit=5)),
         )
         if not results:
             await interaction.followup.send("No results found.")
@@ -1962,41 +2437,35 @@ class MusicCog(commands.Cog):
             gq.search_mode = "spotify"
         else:
             gq.search_mode = "youtube"
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(
             f"Default search mode set to **{gq.search_mode}**."
         )
 
     @app_commands.command(name="maxqueue", description="Set the maximum queue size")
     @app_commands.describe(size="Maximum number of tracks in the queue (1-500)")
-    async def maxqueue(self, interaction: discord.Interaction, size: int) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def maxqueue(self, interaction: discord.Interaction, gq: GuildQueue, size: int) -> None:
         if not 1 <= size <= 500:
             await interaction.response.send_message(
                 "Max queue size must be between 1 and 500.", ephemeral=True
             )
             return
         gq.max_queue = size
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(f"📋 Max queue size set to **{size}** tracks.")
 
     @app_commands.command(name="maxperuser", description="Set the max tracks a single user can have in the queue (0 = unlimited)")
     @app_commands.describe(limit="Max tracks per user, 0 to remove the limit")
-    async def maxperuser(self, interaction: discord.Interaction, limit: int) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def maxperuser(self, interaction: discord.Interaction, gq: GuildQueue, limit: int) -> None:
         if limit < 0:
             await interaction.response.send_message(
                 "Limit must be 0 or higher.", ephemeral=True
             )
             return
         gq.max_per_user = limit
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         if limit == 0:
             await interaction.response.send_message("📋 Per-user queue limit removed.")
         else:
@@ -2020,7 +2489,7 @@ class MusicCog(commands.Cog):
         gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
         gq.np_channel_id = interaction.channel_id
         gq.np_message_id = None
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(
             "📺 Now-playing updates will be posted in this channel when tracks change.\n"
             "Use `/clearnpchannel` to disable."
@@ -2036,16 +2505,13 @@ class MusicCog(commands.Cog):
         gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
         gq.np_channel_id = None
         gq.np_message_id = None
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message("📺 Now-playing channel cleared.")
 
     @app_commands.command(name="remove", description="Remove a track from the queue")
     @app_commands.describe(position="Position in the queue (1-indexed)")
-    async def remove(self, interaction: discord.Interaction, position: int) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def remove(self, interaction: discord.Interaction, gq: GuildQueue, position: int) -> None:
         if position < 1 or position > len(gq.queue):
             await interaction.response.send_message(
                 f"❌ Invalid position. The queue has {len(gq.queue)} tracks.", ephemeral=True
@@ -2053,7 +2519,7 @@ class MusicCog(commands.Cog):
             return
         gq.snapshot(f"Removed #{position}")
         removed = gq.remove_at(position - 1)
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(f"Removed **{removed.title}** from the queue.")
 
     @app_commands.command(name="move", description="Move a track to a different position in the queue")
@@ -2061,11 +2527,8 @@ class MusicCog(commands.Cog):
         from_pos="Current position of the track (1-indexed)",
         to_pos="New position for the track (1-indexed)",
     )
-    async def move(self, interaction: discord.Interaction, from_pos: int, to_pos: int) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def move(self, interaction: discord.Interaction, gq: GuildQueue, from_pos: int, to_pos: int) -> None:
         n = len(gq.queue)
         if from_pos < 1 or from_pos > n or to_pos < 1 or to_pos > n:
             await interaction.response.send_message(
@@ -2082,18 +2545,15 @@ class MusicCog(commands.Cog):
                 f"❌ Invalid position. The queue has {len(gq.queue)} tracks.", ephemeral=True
             )
             return
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(
             f"Moved **{moved.title}** to position #{to_pos}."
         )
 
     @app_commands.command(name="skipto", description="Skip to a specific position in the queue")
     @app_commands.describe(position="Position in the queue to skip to (1-indexed)")
-    async def skipto(self, interaction: discord.Interaction, position: int) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def skipto(self, interaction: discord.Interaction, gq: GuildQueue, position: int) -> None:
         vc: Optional[discord.VoiceClient] = interaction.guild.voice_client  # type: ignore[union-attr, assignment]
         if vc is None:
             await interaction.response.send_message("Not connected.", ephemeral=True)
@@ -2108,32 +2568,26 @@ class MusicCog(commands.Cog):
         target = gq.skip_to(position - 1)
 
         gq.current = None
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
         vc.stop()  # triggers _play_next → pops target from front
         await interaction.response.send_message(f"Skipping to **{target.title}**.")
 
     @app_commands.command(name="clear", description="Clear the queue (keeps current track playing)")
-    async def clear(self, interaction: discord.Interaction) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def clear(self, interaction: discord.Interaction, gq: GuildQueue) -> None:
         count = len(gq.queue)
         if count == 0:
             await interaction.response.send_message("❌ Queue is already empty.", ephemeral=True)
             return
         gq.snapshot("Clear queue")
-        gq.queue.clear()
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        gq.clear_queue()
+        self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
         s = "s" if count != 1 else ""
         await interaction.response.send_message(f"🗑️ Cleared **{count}** track{s} from the queue.")
 
     @app_commands.command(name="shuffle", description="Shuffle the queue, spreading tracks from the same artist evenly")
-    async def shuffle(self, interaction: discord.Interaction) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def shuffle(self, interaction: discord.Interaction, gq: GuildQueue) -> None:
         if len(gq.queue) < 2:
             await interaction.response.send_message(
                 "Not enough tracks to shuffle.", ephemeral=True
@@ -2141,18 +2595,15 @@ class MusicCog(commands.Cog):
             return
         gq.snapshot("Shuffle")
         gq.smart_shuffle()
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(f"🔀 Shuffled **{len(gq.queue)}** tracks.")
 
     @app_commands.command(name="loop", description="Cycle loop mode: off → single → queue → off")
-    async def loop(self, interaction: discord.Interaction) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def loop(self, interaction: discord.Interaction, gq: GuildQueue) -> None:
         gq.loop_mode = gq.loop_mode.next()
-        self.queues.save_settings()
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(f"🔁 Loop: **{gq.loop_mode.label()}**.")
 
     @app_commands.command(name="autoplay", description="Toggle autoplay — auto-queue similar tracks when the queue runs out")
@@ -2164,7 +2615,7 @@ class MusicCog(commands.Cog):
             return
         gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
         gq.autoplay = not gq.autoplay
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         state = "on" if gq.autoplay else "off"
         await interaction.response.send_message(f"✨ Autoplay: **{state}**.")
 
@@ -2190,7 +2641,8 @@ class MusicCog(commands.Cog):
                 await interaction.response.send_message("No DJ role is set.")
             return
         gq.dj_role_id = role.id
-        self.queues.save_settings()
+        gq.dj_cache.clear()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(
             f"🎧 DJ role set to **{role.name}**. Only users with this role (or admins) can use music commands."
         )
@@ -2204,7 +2656,8 @@ class MusicCog(commands.Cog):
             return
         gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
         gq.dj_role_id = None
-        self.queues.save_settings()
+        gq.dj_cache.clear()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message("🔓 DJ role restriction cleared.")
 
     # ── replay / back ───────────────────────────────────────────────────
@@ -2233,7 +2686,7 @@ class MusicCog(commands.Cog):
             return
         track = gq.previous
         gq.previous = None
-        gq.queue.appendleft(track)
+        gq.push_front(track)
         gq.current = None
         vc.stop()  # triggers _play_next → pops track from front
         await interaction.response.send_message(f"Playing previous: **{track.title}**.")
@@ -2241,13 +2694,10 @@ class MusicCog(commands.Cog):
     # ── 24/7 mode ───────────────────────────────────────────────────────
 
     @app_commands.command(name="24-7", description="Toggle 24/7 mode — bot stays connected even when idle or alone")
-    async def stay(self, interaction: discord.Interaction) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def stay(self, interaction: discord.Interaction, gq: GuildQueue) -> None:
         gq.stay_connected = not gq.stay_connected
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         state = "on" if gq.stay_connected else "off"
         await interaction.response.send_message(f"🕐 24/7 mode: **{state}**.")
 
@@ -2263,11 +2713,8 @@ class MusicCog(commands.Cog):
         app_commands.Choice(name="Karaoke", value="karaoke"),
         app_commands.Choice(name="None", value="none"),
     ])
-    async def filter_cmd(self, interaction: discord.Interaction, name: str) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def filter_cmd(self, interaction: discord.Interaction, gq: GuildQueue, name: str) -> None:
         vc: Optional[discord.VoiceClient] = interaction.guild.voice_client  # type: ignore[union-attr, assignment]
         if vc is None or (not vc.is_playing() and not vc.is_paused()):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
@@ -2277,28 +2724,24 @@ class MusicCog(commands.Cog):
             return
 
         gq.filter_name = name if name != "none" else None
-        self.queues.save_settings()
-
-        await interaction.response.defer()
-        elapsed = self._get_elapsed(gq)
-        await self._restart_playback(interaction.guild, seek_seconds=elapsed)
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
+        # Coalesce rapid filter/speed/normalize changes into one ffmpeg restart
+        self._schedule_restart(interaction.guild)  # type: ignore[arg-type]
 
         label = name if name != "none" else "off"
-        await interaction.followup.send(f"🎛️ Filter: **{label}**.")
+        await interaction.response.send_message(f"🎛️ Filter: **{label}**.")
 
     @app_commands.command(name="seek", description="Seek to a position in the current track")
     @app_commands.describe(position="Absolute (1:30, 90) or relative (+30 or -15 seconds)")
-    async def seek(self, interaction: discord.Interaction, position: str) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def seek(self, interaction: discord.Interaction, gq: GuildQueue, position: str) -> None:
         vc: Optional[discord.VoiceClient] = interaction.guild.voice_client  # type: ignore[union-attr, assignment]
         if vc is None or (not vc.is_playing() and not vc.is_paused()):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
             return
 
-        if gq.current and gq.current.is_live:
+        cur = gq.current
+        if cur and cur.is_live:
             await interaction.response.send_message("Cannot seek in a live stream.", ephemeral=True)
             return
 
@@ -2319,24 +2762,28 @@ class MusicCog(commands.Cog):
             )
             return
 
+        elapsed = self._get_elapsed(gq)
         if relative_dir != 0:
-            secs = max(0, self._get_elapsed(gq) + relative_dir * secs)
+            secs = max(0, elapsed + relative_dir * secs)
 
-        if gq.current and gq.current.duration and secs > gq.current.duration:
+        duration = cur.duration if cur else 0
+        if duration and secs > duration:
             await interaction.response.send_message("Seek position is past the end of the track.", ephemeral=True)
             return
 
+        # Restarting ffmpeg to land on the current second only adds a gap of silence
+        if secs == elapsed:
+            await interaction.response.send_message("Already at that position.", ephemeral=True)
+            return
+
         await interaction.response.defer()
         await self._restart_playback(interaction.guild, seek_seconds=secs)
         await interaction.followup.send(f"⏩ Seeked to **{format_duration(secs)}**.")
 
     @app_commands.command(name="speed", description="Set playback speed (0.5x - 2.0x)")
     @app_commands.describe(rate="Speed multiplier (0.5 to 2.0)")
-    async def speed(self, interaction: discord.Interaction, rate: float) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def speed(self, interaction: discord.Interaction, gq: GuildQueue, rate: float) -> None:
         vc: Optional[discord.VoiceClient] = interaction.guild.voice_client  # type: ignore[union-attr, assignment]
         if vc is None or (not vc.is_playing() and not vc.is_paused()):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
@@ -2350,20 +2797,17 @@ class MusicCog(commands.Cog):
             await interaction.response.send_message("Cannot change speed on a live stream.", ephemeral=True)
             return
 
-        elapsed = self._get_elapsed(gq)
+        # Re-anchor the start time so the position reads the same at the new rate
+        if gq.play_start_time:
+            gq.play_start_time = time.monotonic() - self._get_elapsed(gq) / rate
         gq.speed = rate
-        self.queues.save_settings()
-
-        await interaction.response.defer()
-        await self._restart_playback(interaction.guild, seek_seconds=elapsed)
-        await interaction.followup.send(f"⚡ Speed: **{rate}x**.")
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_restart(interaction.guild)  # type: ignore[arg-type]
+        await interaction.response.send_message(f"⚡ Speed: **{rate}x**.")
 
     @app_commands.command(name="normalize", description="Toggle loudness normalization to balance volume differences between tracks")
-    async def normalize(self, interaction: discord.Interaction) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def normalize(self, interaction: discord.Interaction, gq: GuildQueue) -> None:
         vc: Optional[discord.VoiceClient] = interaction.guild.voice_client  # type: ignore[union-attr, assignment]
         if vc is None or (not vc.is_playing() and not vc.is_paused()):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
@@ -2372,17 +2816,34 @@ class MusicCog(commands.Cog):
             await interaction.response.send_message("Cannot normalize a live stream.", ephemeral=True)
             return
 
-        elapsed = self._get_elapsed(gq)
         gq.normalize = not gq.normalize
-        self.queues.save_settings()
-
-        await interaction.response.defer()
-        await self._restart_playback(interaction.guild, seek_seconds=elapsed)
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_restart(interaction.guild)  # type: ignore[arg-type]
         state = "on" if gq.normalize else "off"
-        await interaction.followup.send(f"📊 Loudness normalization: **{state}**.")
+        await interaction.response.send_message(f"📊 Loudness normalization: **{state}**.")
 
     # ── lyrics ───────────────────────────────────────────────────────────
 
+    async def _fetch_lyrics(self, artist: str, search_title: str) -> dict | None:
+        """Look a track up on lrclib.net; raises if the search endpoint fails."""
+        session: aiohttp.ClientSession = self._http  # type: ignore[assignment]  # opened in cog_load
+        # Try exact-match endpoint first (much more accurate)
+        if artist and search_title:
+            async with session.get(
+                _LRCLIB_GET_URL.with_query(track_name=search_title, artist_name=artist)
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json(loads=_json_loads)
+                    if isinstance(data, dict) and (data.get("plainLyrics") or data.get("syncedLyrics")):
+                        return data
+
+        # Fall back to fuzzy search
+        q = f"{artist} {search_title}".strip() if artist else search_title
+        async with session.get(_LRCLIB_SEARCH_URL.with_query(q=q)) as resp:
+            resp.raise_for_status()
+            results = await resp.json(loads=_json_loads)
+            return results[0] if isinstance(results, list) and results else None
+
     @app_commands.command(name="lyrics", description="Show lyrics for the current or specified track")
     @app_commands.describe(query="Search query (defaults to current track)")
     async def lyrics(self, interaction: discord.Interaction, query: str | None = None) -> None:
@@ -2406,39 +2867,17 @@ class MusicCog(commands.Cog):
 
         await interaction.response.defer()
 
-        try:
-            async with aiohttp.ClientSession() as session:
-                hit = None
-
-                # Try exact-match endpoint first (much more accurate)
-                if artist and search_title:
-                    async with session.get(
-                        "https://lrclib.net/api/get",
-                        params={"track_name": search_title, "artist_name": artist},
-                        timeout=aiohttp.ClientTimeout(total=10),
-                    ) as resp:
-                        if resp.status == 200:
-                            data = await resp.json()
-                            if data and (data.get("plainLyrics") or data.get("syncedLyrics")):
-                                hit = data
-
-                # Fall back to fuzzy search
-                if hit is None:
-                    q = f"{artist} {search_title}".strip() if artist else search_title
-                    async with session.get(
-                        "https://lrclib.net/api/search",
-                        params={"q": q},
-                        timeout=aiohttp.ClientTimeout(total=10),
-                    ) as resp:
-                        if resp.status != 200:
-                            await interaction.followup.send("Could not fetch lyrics.")
-                            return
-                        results = await resp.json()
-                        if results:
-                            hit = results[0]
-        except Exception:
-            await interaction.followup.send("Could not fetch lyrics.")
-            return
+        key = _normalize_query(f"{artist} {search_title}")
+        hit = self._lyrics_cache.get(key)
+        if hit is None:
+            try:
+                hit = await self._fetch_lyrics(artist, search_title)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):  # ValueError: bad JSON
+                await interaction.followup.send("Could not fetch lyrics.")
+                return
+            if hit is not None:
+                hit = {k: hit[k] for k in _LYRICS_KEYS if k in hit}
+                self._lyrics_cache.put(key, hit)
 
         if hit is None:
             await interaction.followup.send(f"No lyrics found for **{search_title or query}**.")
@@ -2457,7 +2896,7 @@ class MusicCog(commands.Cog):
             embed = discord.Embed(
                 title="Lyrics",
                 description=f"{header}\n\n{text}",
-                color=discord.Color.blurple(),
+                color=_COLOR_BLURPLE,
             )
             await interaction.followup.send(embed=embed)
         else:
@@ -2467,23 +2906,29 @@ class MusicCog(commands.Cog):
             first_limit = 4096 - header_overhead
             chunk_limit = 4096
 
+            # Walk an offset through the text rather than re-slicing the remainder
+            # on every page, so long lyrics aren't copied once per chunk
             chunks: list[str] = []
-            first = True
-            while text:
-                limit = first_limit if first else chunk_limit
-                cut = text[:limit]
-                nl = cut.rfind("\n")
-                if nl > limit // 2:
-                    cut = text[:nl]
-                chunks.append(cut)
-                text = text[len(cut):].lstrip("\n")
-                first = False
+            pos, n = 0, len(text)
+            limit = first_limit
+            while pos < n:
+                end = min(pos + limit, n)
+                if end < n:
+                    # Break on the last newline in the back half of the page, if any
+                    nl = text.rfind("\n", pos + limit // 2 + 1, end)
+                    if nl != -1:
+                        end = nl
+                chunks.append(text[pos:end])
+                pos = end
+                while pos < n and text[pos] == "\n":
+                    pos += 1
+                limit = chunk_limit
 
             for i, chunk in enumerate(chunks):
                 embed = discord.Embed(
                     title=f"Lyrics ({i + 1}/{len(chunks)})" if len(chunks) > 1 else "Lyrics",
                     description=f"{header}\n\n{chunk}" if i == 0 else chunk,
-                    color=discord.Color.blurple(),
+                    color=_COLOR_BLURPLE,
                 )
                 await interaction.followup.send(embed=embed)
 
@@ -2497,8 +2942,8 @@ class MusicCog(commands.Cog):
             return
 
         # Count listeners (non-bot members in the voice channel)
-        listeners = [m for m in vc.channel.members if not m.bot]
-        if len(listeners) <= 1:
+        listener_count = sum(1 for m in vc.channel.members if not m.bot)
+        if listener_count <= 1:
             # Solo — just skip
             gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
             title = gq.current.title if gq.current else "current track"
@@ -2506,7 +2951,7 @@ class MusicCog(commands.Cog):
             await interaction.response.send_message(f"Skipped **{title}**.")
             return
 
-        required = math.ceil(len(listeners) / 2)
+        required = (listener_count + 1) // 2
         view = VoteSkipView(self, interaction.guild, required)  # type: ignore[arg-type]
         view.voters.add(interaction.user.id)
         view.children[0].label = f"Skip (1/{required})"  # type: ignore[union-attr]
@@ -2531,14 +2976,13 @@ class MusicCog(commands.Cog):
             await interaction.response.send_message("No play history yet.", ephemeral=True)
             return
 
-        lines = [
-            f"`{i + 1}.` **{title}** — {count} play{'s' if count != 1 else ''}"
-            for i, (title, _url, count) in enumerate(top_tracks)
-        ]
         embed = discord.Embed(
             title=f"🏆 Most Played — {interaction.guild.name}",  # type: ignore[union-attr]
-            description="\n".join(lines),
-            color=discord.Color.gold(),
+            description="\n".join(
+                f"`{i}.` **{title}** — {count} play{'s' if count != 1 else ''}"
+                for i, (title, _url, count) in enumerate(top_tracks, 1)
+            ),
+            color=_COLOR_GOLD,
         )
         await interaction.response.send_message(embed=embed)
 
@@ -2551,12 +2995,16 @@ class MusicCog(commands.Cog):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
             return
 
-        ok = self.favorites.add(
-            interaction.user.id, gq.current, guild_id=interaction.guild.id  # type: ignore[union-attr]
+        # Capture the track now — gq.current can change while the write runs
+        track = gq.current
+        user_id = interaction.user.id
+        guild_id = interaction.guild.id  # type: ignore[union-attr]
+        ok = await self.bot.loop.run_in_executor(
+            self._io_pool, lambda: self.favorites.add(user_id, track, guild_id=guild_id)
         )
         if ok:
             await interaction.response.send_message(
-                f"Saved **{gq.current.title}** to your favorites."
+                f"Saved **{track.title}** to your favorites."
             )
         else:
             await interaction.response.send_message(
@@ -2574,28 +3022,34 @@ class MusicCog(commands.Cog):
             )
             return
 
-        lines = []
         current_guild_id = interaction.guild.id if interaction.guild else 0  # type: ignore[union-attr]
-        for i, f in enumerate(favs):
-            fav_guild_id = f.get("guild_id", 0)
-            guild_tag = ""
-            if fav_guild_id and fav_guild_id != current_guild_id:
-                g = self.bot.get_guild(fav_guild_id)
-                guild_tag = f" *[{g.name if g else 'Other Server'}]*"
-            lines.append(
-                f"`{i + 1}.` {f['title']} [{format_duration(f.get('duration', 0))}]{guild_tag}"
-            )
+        # Resolve each foreign guild's tag once, not once per favorite
+        guild_tags: dict[int, str] = {0: "", current_guild_id: ""}
+
+        def _guild_tag(guild_id: int) -> str:
+            tag = guild_tags.get(guild_id)
+            if tag is None:
+                g = self.bot.get_guild(guild_id)
+                tag = guild_tags[guild_id] = f" *[{g.name if g else 'Other Server'}]*"
+            return tag
+
         embed = discord.Embed(
             title=f"❤️ Favorites — {interaction.user.display_name}",
-            description="\n".join(lines),
-            color=discord.Color.purple(),
+            description="\n".join(
+                f"`{i}.` {f['title']} [{format_duration(f.get('duration', 0))}]"
+                f"{_guild_tag(f.get('guild_id', 0))}"
+                for i, f in enumerate(favs, 1)
+            ),
+            color=_COLOR_PURPLE,
         )
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="unfav", description="Remove a track from your favorites")
     @app_commands.describe(position="Position in your favorites list (1-indexed)")
     async def unfav(self, interaction: discord.Interaction, position: int) -> None:
-        removed = self.favorites.remove(interaction.user.id, position - 1)
+        removed = await self.bot.loop.run_in_executor(
+            self._io_pool, self.favorites.remove, interaction.user.id, position - 1
+        )
         if removed is None:
             await interaction.response.send_message(
                 "❌ Invalid position.", ephemeral=True
@@ -2630,25 +3084,12 @@ class MusicCog(commands.Cog):
         if vc is None:
             return
 
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
+        gq = self.queues.get(guild_id)
         gq.text_channel_id = interaction.channel_id
-        count = 0
-        fav_skip_reason = "queue full"
-        fav_user_id = interaction.user.id
-        fav_user_queued = sum(
-            1 for t in gq.queue
-            if t.requester_id == fav_user_id or (t.requester_id == 0 and t.requester == interaction.user.display_name)
-        )
-        for track in tracks:
-            if gq.max_per_user > 0 and fav_user_queued >= gq.max_per_user:
-                fav_skip_reason = f"per-user limit of {gq.max_per_user}"
-                break
-            if gq.add(track) is None:
-                break
-            count += 1
-            fav_user_queued += 1
+        take, fav_skip_reason = gq.room_for(interaction.user.id, interaction.user.display_name, len(tracks))
+        count = gq.extend(itertools.islice(tracks, take))
 
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(guild_id)
 
         if not vc.is_playing() and not vc.is_paused():
             await self._play_next(interaction.guild)  # type: ignore[arg-type]
@@ -2670,26 +3111,39 @@ class MusicCog(commands.Cog):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
             return
 
+        user_id = interaction.user.id
+        dm_error = "❌ I can't DM you. Please enable DMs from server members in your Privacy Settings."
+        blocked_at = self._dm_blocked.get(user_id)
+        if blocked_at is not None and time.monotonic() - blocked_at < self.DM_BLOCK_RETRY:
+            await interaction.response.send_message(dm_error, ephemeral=True)
+            return
+
         track = gq.current
-        embed = discord.Embed(
-            title="📌 Saved Track",
-            description=f"**{track.title}**",
-            color=discord.Color.green(),
-        )
-        if track.url:
-            embed.add_field(name="🔗 URL", value=track.url, inline=False)
-        embed.add_field(name="⏱️ Duration", value=format_duration(track.duration))
-        embed.add_field(name="👤 Requested by", value=track.requester or "Unknown")
-        if track.thumbnail:
-            embed.set_thumbnail(url=track.thumbnail)
+        key = (track.url, track.requester)
+        cached = self._grab_cache.get(user_id)
+        if cached is not None and cached[0] == key:
+            embed = cached[1]
+        else:
+            embed = discord.Embed(
+                title="📌 Saved Track",
+                description=f"**{track.title}**",
+                color=_COLOR_GREEN,
+            )
+            if track.url:
+                embed.add_field(name="🔗 URL", value=track.url, inline=False)
+            embed.add_field(name="⏱️ Duration", value=format_duration(track.duration))
+            embed.add_field(name="👤 Requested by", value=track.requester or "Unknown")
+            if track.thumbnail:
+                embed.set_thumbnail(url=track.thumbnail)
+            self._grab_cache[user_id] = (key, embed)
 
         try:
             await interaction.user.send(embed=embed)
+            self._dm_blocked.pop(user_id, None)
             await interaction.response.send_message("📬 Track info sent to your DMs!", ephemeral=True)
         except discord.Forbidden:
-            await interaction.response.send_message(
-                "❌ I can't DM you. Please enable DMs from server members in your Privacy Settings.", ephemeral=True
-            )
+            self._dm_blocked[user_id] = time.monotonic()
+            await interaction.response.send_message(dm_error, ephemeral=True)
 
     # ── saved playlists ──────────────────────────────────────────────────
 
@@ -2698,9 +3152,18 @@ class MusicCog(commands.Cog):
     async def _playlist_name_autocomplete(
         self, interaction: discord.Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
-        names = self.playlists.names(interaction.guild.id)  # type: ignore[union-attr]
-        filtered = [n for n in names if current.lower() in n.lower()]
-        return [app_commands.Choice(name=n, value=n) for n in filtered[:25]]
+        guild_id = interaction.guild.id  # type: ignore[union-attr]
+        entries = self._pl_name_cache.get(guild_id)
+        if entries is None:
+            entries = self._pl_name_cache[guild_id] = [
+                (n.lower(), app_commands.Choice(name=n, value=n)) for n in self.playlists.names(guild_id)
+            ]
+        # PlaylistManager caps guilds at 25 playlists, Discord's choice limit,
+        # so every match fits and an empty query is just the full list
+        if not current:
+            return [choice for _, choice in entries]
+        cur = current.lower()
+        return [choice for low, choice in entries if cur in low]
 
     @playlist_group.command(name="save", description="Save the current queue as a named playlist")
     @app_commands.describe(name="Playlist name (max 64 characters)")
@@ -2709,22 +3172,21 @@ class MusicCog(commands.Cog):
             await interaction.response.send_message("Name must be 64 characters or less.", ephemeral=True)
             return
         gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        tracks: list[TrackInfo] = []
-        if gq.current:
-            tracks.append(gq.current)
-        tracks.extend(gq.queue)
-        if not tracks:
+        head = (gq.current,) if gq.current else ()
+        total = len(head) + len(gq.queue)
+        if not total:
             await interaction.response.send_message("Nothing to save — queue is empty.", ephemeral=True)
             return
         err = self.playlists.save(
-            interaction.guild.id, name, tracks,  # type: ignore[union-attr]
+            interaction.guild.id, name, itertools.chain(head, gq.queue),  # type: ignore[union-attr]
             created_by=str(interaction.user.id),
         )
         if err:
             await interaction.response.send_message(err, ephemeral=True)
             return
+        self._pl_name_cache.pop(interaction.guild.id, None)  # type: ignore[union-attr]
         await interaction.response.send_message(
-            f"Saved playlist **{name}** with **{len(tracks)}** track{'s' if len(tracks) != 1 else ''}."
+            f"Saved playlist **{name}** with **{total}** track{'s' if total != 1 else ''}."
         )
 
     @playlist_group.command(name="load", description="Queue tracks from a saved playlist")
@@ -2740,27 +3202,19 @@ class MusicCog(commands.Cog):
         if vc is None:
             return
 
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
+        guild_id = interaction.guild.id  # type: ignore[union-attr]
+        gq = self.queues.get(guild_id)
         gq.text_channel_id = interaction.channel_id
-        count = 0
-        pl_skip_reason = "queue full"
         pl_user_id = interaction.user.id
-        pl_user_queued = sum(
-            1 for t in gq.queue
-            if t.requester_id == pl_user_id or (t.requester_id == 0 and t.requester == interaction.user.display_name)
-        )
-        for track in tracks:
-            if gq.max_per_user > 0 and pl_user_queued >= gq.max_per_user:
-                pl_skip_reason = f"per-user limit of {gq.max_per_user}"
-                break
-            track.requester = interaction.user.display_name
+        pl_user_name = interaction.user.display_name
+        take, pl_skip_reason = gq.room_for(pl_user_id, pl_user_name, len(tracks))
+        batch = tracks[:take]
+        for track in batch:
+            track.requester = pl_user_name
             track.requester_id = pl_user_id
-            if gq.add(track) is None:
-                break
-            count += 1
-            pl_user_queued += 1
+        count = gq.extend(batch)
 
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(guild_id)
 
         if not vc.is_playing() and not vc.is_paused():
             await self._play_next(interaction.guild)  # type: ignore[arg-type]
@@ -2779,20 +3233,22 @@ class MusicCog(commands.Cog):
         if not playlists:
             await interaction.response.send_message("No saved playlists.", ephemeral=True)
             return
-        lines: list[str] = []
-        for pl in playlists:
+        # created_by is stored as user ID string; resolve all creators in one go
+        creator_ids = [int(c) for pl in playlists if (c := pl.get("created_by", "?")).isdigit()]
+        members = await self._resolve_members(interaction.guild, creator_ids)  # type: ignore[arg-type]
+
+        def _line(pl: dict) -> str:
             count = len(pl.get("tracks", []))
-            creator_raw = pl.get("created_by", "?")
-            # created_by is stored as user ID string; try to resolve to a name
-            creator_display = creator_raw
+            creator_display = creator_raw = pl.get("created_by", "?")
             if creator_raw.isdigit():
-                member = interaction.guild.get_member(int(creator_raw))  # type: ignore[union-attr]
+                member = members.get(int(creator_raw))
                 creator_display = member.display_name if member else f"<@{creator_raw}>"
-            lines.append(f"**{pl['name']}** — {count} track{'s' if count != 1 else ''} (by {creator_display})")
+            return f"**{pl['name']}** — {count} track{'s' if count != 1 else ''} (by {creator_display})"
+
         embed = discord.Embed(
             title=f"🎵 Playlists — {interaction.guild.name}",  # type: ignore[union-attr]
-            description="\n".join(lines),
-            color=discord.Color.blurple(),
+            description="\n".join(map(_line, playlists)),
+            color=_COLOR_BLURPLE,
         )
         await interaction.response.send_message(embed=embed)
 
@@ -2815,6 +3271,7 @@ class MusicCog(commands.Cog):
             )
             return
         self.playlists.delete(guild_id, name)
+        self._pl_name_cache.pop(guild_id, None)
         await interaction.response.send_message(f"Deleted playlist **{name}**.")
 
     # ── collaborative playlists ──────────────────────────────────────────
@@ -2873,9 +3330,9 @@ class MusicCog(commands.Cog):
         if creator is None:
             await interaction.response.send_message(f"Playlist **{name}** not found.", ephemeral=True)
             return
-        is_creator = creator == str(interaction.user.id)
-        is_collab = self.playlists.is_collaborator(guild_id, name, interaction.user.id)
-        if not is_creator and not is_collab:
+        if creator != str(interaction.user.id) and not self.playlists.is_collaborator(
+            guild_id, name, interaction.user.id
+        ):
             await interaction.response.send_message("You must be the creator or a collaborator.", ephemeral=True)
             return
         err = self.playlists.add_track_to_playlist(guild_id, name, gq.current)
@@ -2895,9 +3352,9 @@ class MusicCog(commands.Cog):
         if creator is None:
             await interaction.response.send_message(f"Playlist **{name}** not found.", ephemeral=True)
             return
-        is_creator = creator == str(interaction.user.id)
-        is_collab = self.playlists.is_collaborator(guild_id, name, interaction.user.id)
-        if not is_creator and not is_collab:
+        if creator != str(interaction.user.id) and not self.playlists.is_collaborator(
+            guild_id, name, interaction.user.id
+        ):
             await interaction.response.send_message("You must be the creator or a collaborator.", ephemeral=True)
             return
         removed = self.playlists.remove_track_from_playlist(guild_id, name, position - 1)
@@ -2917,17 +3374,19 @@ class MusicCog(commands.Cog):
         app_commands.Choice(name="Vocal", value="vocal"),
         app_commands.Choice(name="Electronic", value="electronic"),
     ])
-    async def eq(self, interaction: discord.Interaction, preset: str) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def eq(self, interaction: discord.Interaction, gq: GuildQueue, preset: str) -> None:
         vc: Optional[discord.VoiceClient] = interaction.guild.voice_client  # type: ignore[union-attr, assignment]
         if vc is None or (not vc.is_playing() and not vc.is_paused()):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
             return
-        gq.eq_bands = list(EQ_PRESETS[preset])
-        self.queues.save_settings()
+        if gq.eq_bands == EQ_PRESETS[preset]:
+            await interaction.response.send_message(
+                f"🎚️ EQ preset **{preset.replace('_', ' ').title()}** is already applied.", ephemeral=True
+            )
+            return
+        gq.eq_bands = EQ_PRESETS[preset]
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.defer()
         elapsed = self._get_elapsed(gq)
         await self._restart_playback(interaction.guild, seek_seconds=elapsed)  # type: ignore[arg-type]
@@ -2935,11 +3394,8 @@ class MusicCog(commands.Cog):
 
     @app_commands.command(name="eqcustom", description="Boost or cut a specific EQ frequency band (-12 to +12 dB)")
     @app_commands.describe(band="Band number (1-10)", gain="Gain in dB (-12 to +12)")
-    async def eqcustom(self, interaction: discord.Interaction, band: int, gain: float) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def eqcustom(self, interaction: discord.Interaction, gq: GuildQueue, band: int, gain: float) -> None:
         if not 1 <= band <= 10:
             await interaction.response.send_message("Band must be 1-10.", ephemeral=True)
             return
@@ -2950,14 +3406,17 @@ class MusicCog(commands.Cog):
         if vc is None or (not vc.is_playing() and not vc.is_paused()):
             await interaction.response.send_message("❌ Nothing is playing. Use `/play` to queue a track.", ephemeral=True)
             return
-        gq.eq_bands[band - 1] = gain
-        self.queues.save_settings()
-        await interaction.response.defer()
-        elapsed = self._get_elapsed(gq)
-        await self._restart_playback(interaction.guild, seek_seconds=elapsed)  # type: ignore[arg-type]
-        from music.audio_source import EQ_BANDS
-        band_name = EQ_BANDS[band - 1][0]
-        await interaction.followup.send(f"EQ band {band} ({band_name}): **{gain:+.1f} dB**.")
+        band_name = _EQ_BAND_NAMES[band - 1]
+        if gq.eq_bands[band - 1] == gain:
+            await interaction.response.send_message(
+                f"EQ band {band} ({band_name}) is already at **{gain:+.1f} dB**.", ephemeral=True
+            )
+            return
+        gq.set_eq_band(band - 1, gain)
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
+        # Users tend to tweak several bands in a row; restart ffmpeg once for the lot
+        self._schedule_restart(interaction.guild)  # type: ignore[arg-type]
+        await interaction.response.send_message(f"EQ band {band} ({band_name}): **{gain:+.1f} dB**.")
 
     # ── similar / radio ──────────────────────────────────────────────────
 
@@ -2975,7 +3434,7 @@ class MusicCog(commands.Cog):
         await interaction.response.defer()
         try:
             results = await self.bot.loop.run_in_executor(
-                None, lambda: self.spotify.recommend_multiple(current_title, 5)
+                self._io_pool, lambda: self.spotify.recommend_multiple(current_title, 5)
             )
         except Exception as exc:
             log.warning("Similar tracks lookup failed: %s", exc)
@@ -2990,7 +3449,7 @@ class MusicCog(commands.Cog):
         embed = discord.Embed(
             title=f"Similar to: {current_title}",
             description="\n".join(lines),
-            color=discord.Color.green(),
+            color=_COLOR_GREEN,
         )
         view = SearchView(results, self, interaction)
         await interaction.followup.send(embed=embed, view=view)
@@ -3007,7 +3466,7 @@ class MusicCog(commands.Cog):
 
         try:
             results = await self.bot.loop.run_in_executor(
-                None, lambda: self.spotify.recommend_by_seed(seed, set(), 5)
+                self._io_pool, lambda: self.spotify.recommend_by_seed(seed, set(), 5)
             )
         except Exception as exc:
             log.warning("Radio seed lookup failed: %s", exc)
@@ -3022,7 +3481,9 @@ class MusicCog(commands.Cog):
 
         gq.radio_mode = True
         gq.radio_seed = seed
-        gq.radio_history = {tid for tid, _ in results}
+        gq.radio_history.clear()
+        gq.radio_history.update(tid for tid, _ in results)
+        gq.radio_buffer.clear()
 
         count = 0
         for _, track in results:
@@ -3049,6 +3510,7 @@ class MusicCog(commands.Cog):
         gq.radio_mode = False
         gq.radio_seed = None
         gq.radio_history.clear()
+        gq.radio_buffer.clear()
         await interaction.response.send_message("📻 Radio mode stopped.")
 
     # ── queue import/export ──────────────────────────────────────────────
@@ -3056,32 +3518,27 @@ class MusicCog(commands.Cog):
     @app_commands.command(name="queue-export", description="Export the queue as a shareable code")
     async def queue_export(self, interaction: discord.Interaction) -> None:
         gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        tracks: list[dict] = []
-        if gq.current:
-            tracks.append({"t": gq.current.title, "u": gq.current.url, "d": gq.current.duration})
-        for t in gq.queue:
-            tracks.append({"t": t.title, "u": t.url, "d": t.duration})
+        head = (gq.current,) if gq.current else ()
+        tracks = [{"t": t.title, "u": t.url, "d": t.duration} for t in itertools.chain(head, gq.queue)]
         if not tracks:
             await interaction.response.send_message("Nothing to export.", ephemeral=True)
             return
-        data = base64.b64encode(json.dumps(tracks, separators=(",", ":")).encode()).decode()
+        # A full 500-track queue is ~100 KB of JSON; encode it off the event loop
+        data = await self.bot.loop.run_in_executor(None, _encode_queue_code, tracks)
         if len(data) <= 1900:
             await interaction.response.send_message(f"```\n{data}\n```")
         else:
-            import io
             file = discord.File(io.BytesIO(data.encode()), filename="queue.txt")
             await interaction.response.send_message("Queue exported:", file=file)
 
     @app_commands.command(name="queue-import", description="Import a queue from an exported code")
     @app_commands.describe(code="The exported queue code")
     async def queue_import(self, interaction: discord.Interaction, code: str) -> None:
-        try:
-            raw = base64.b64decode(code.strip().strip("`")).decode()
-            items = json.loads(raw)
-        except Exception:
+        items = _decode_queue_code(code)
+        if items is None:
             await interaction.response.send_message("Invalid queue code.", ephemeral=True)
             return
-        if not isinstance(items, list) or not items:
+        if not items:
             await interaction.response.send_message("❌ No tracks found in that code.", ephemeral=True)
             return
 
@@ -3089,32 +3546,19 @@ class MusicCog(commands.Cog):
         if vc is None:
             return
 
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
+        guild_id = interaction.guild.id  # type: ignore[union-attr]
+        gq = self.queues.get(guild_id)
         gq.text_channel_id = interaction.channel_id
-        count = 0
-        imp_skip_reason = "queue full"
         imp_user_id = interaction.user.id
-        imp_user_queued = sum(
-            1 for t in gq.queue
-            if t.requester_id == imp_user_id or (t.requester_id == 0 and t.requester == interaction.user.display_name)
+        imp_user_name = interaction.user.display_name
+        take, imp_skip_reason = gq.room_for(imp_user_id, imp_user_name, len(items))
+        make_track = functools.partial(TrackInfo, requester=imp_user_name, requester_id=imp_user_id)
+        count = gq.extend(
+            make_track(title=title, url=url, duration=duration)
+            for title, url, duration in itertools.islice(items, take)
         )
-        for item in items:
-            if gq.max_per_user > 0 and imp_user_queued >= gq.max_per_user:
-                imp_skip_reason = f"per-user limit of {gq.max_per_user}"
-                break
-            track = TrackInfo(
-                title=item.get("t", "Unknown"),
-                url=item.get("u", ""),
-                duration=item.get("d", 0),
-                requester=interaction.user.display_name,
-                requester_id=imp_user_id,
-            )
-            if gq.add(track) is None:
-                break
-            count += 1
-            imp_user_queued += 1
 
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(guild_id)
         if not vc.is_playing() and not vc.is_paused():
             await self._play_next(interaction.guild)  # type: ignore[arg-type]
 
@@ -3138,7 +3582,7 @@ class MusicCog(commands.Cog):
         embed = discord.Embed(
             title="Rate this track",
             description=f"**{gq.current.title}**",
-            color=discord.Color.gold(),
+            color=_COLOR_GOLD,
         )
         await interaction.response.send_message(embed=embed, view=view)
 
@@ -3155,7 +3599,7 @@ class MusicCog(commands.Cog):
         embed = discord.Embed(
             title=f"⭐ Top Rated — {interaction.guild.name}",  # type: ignore[union-attr]
             description="\n".join(lines),
-            color=discord.Color.gold(),
+            color=_COLOR_GOLD,
         )
         await interaction.response.send_message(embed=embed)
 
@@ -3168,25 +3612,31 @@ class MusicCog(commands.Cog):
             await interaction.response.send_message("No play history yet.", ephemeral=True)
             return
         hours = data["total_time_seconds"] / 3600
-        lines = [
+        header = (
             f"**Total plays:** {data['total_plays']}",
             f"**Unique tracks:** {data['unique_tracks']}",
             f"**Total listening time:** {hours:.1f} hours",
+        )
+        track_lines = [
+            f"`{i}.` {title} — {count} plays"
+            for i, (title, count) in enumerate(data["top_tracks"][:5], 1)
         ]
-        if data["top_tracks"]:
-            lines.append("\n**Top Tracks:**")
-            for i, (title, count) in enumerate(data["top_tracks"][:5]):
-                lines.append(f"`{i + 1}.` {title} — {count} plays")
+        user_lines: list[str] = []
         if data["top_users"]:
-            lines.append("\n**Top Listeners:**")
-            for i, (uid, count) in enumerate(data["top_users"][:5]):
-                member = interaction.guild.get_member(uid)  # type: ignore[union-attr]
-                name = member.display_name if member else f"User {uid}"
-                lines.append(f"`{i + 1}.` {name} — {count} plays")
+            top_users = data["top_users"][:5]
+            members = await self._resolve_members(interaction.guild, [uid for uid, _ in top_users])  # type: ignore[arg-type]
+            user_lines = [
+                f"`{i}.` {m.display_name if (m := members.get(uid)) else f'User {uid}'} — {count} plays"
+                for i, (uid, count) in enumerate(top_users, 1)
+            ]
         embed = discord.Embed(
             title=f"📊 Server Stats — {interaction.guild.name}",  # type: ignore[union-attr]
-            description="\n".join(lines),
-            color=discord.Color.blue(),
+            description="\n".join(itertools.chain(
+                header,
+                ("\n**Top Tracks:**",) if track_lines else (), track_lines,
+                ("\n**Top Listeners:**",) if user_lines else (), user_lines,
+            )),
+            color=_COLOR_BLUE,
         )
         await interaction.response.send_message(embed=embed)
 
@@ -3197,18 +3647,20 @@ class MusicCog(commands.Cog):
             await interaction.response.send_message("No listening history for you yet.", ephemeral=True)
             return
         hours = data["total_time_seconds"] / 3600
-        lines = [
+        header = (
             f"**Total plays:** {data['total_plays']}",
             f"**Total listening time:** {hours:.1f} hours",
+        )
+        track_lines = [
+            f"`{i}.` {title} — {count} plays"
+            for i, (title, count) in enumerate(data["top_tracks"][:5], 1)
         ]
-        if data["top_tracks"]:
-            lines.append("\n**Your Top Tracks:**")
-            for i, (title, count) in enumerate(data["top_tracks"][:5]):
-                lines.append(f"`{i + 1}.` {title} — {count} plays")
         embed = discord.Embed(
             title=f"📊 Your Stats — {interaction.user.display_name}",
-            description="\n".join(lines),
-            color=discord.Color.purple(),
+            description="\n".join(itertools.chain(
+                header, ("\n**Your Top Tracks:**",) if track_lines else (), track_lines,
+            )),
+            color=_COLOR_PURPLE,
         )
         await interaction.response.send_message(embed=embed)
 
@@ -3236,7 +3688,7 @@ class MusicCog(commands.Cog):
         if desc is None:
             await interaction.response.send_message("Nothing to undo.", ephemeral=True)
             return
-        self.queues.save_queue_state(interaction.guild.id)  # type: ignore[union-attr]
+        self._schedule_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(f"Undone: **{desc}**. Queue restored.")
 
     # ── language ──────────────────────────────────────────────────────────
@@ -3244,33 +3696,28 @@ class MusicCog(commands.Cog):
     @app_commands.command(name="language", description="Set the bot language for this server")
     @app_commands.describe(lang="Language code (e.g. en, tr, de)")
     async def language(self, interaction: discord.Interaction, lang: str) -> None:
-        from music.i18n import available_locales
-        available = available_locales()
-        if lang not in available:
+        if not has_locale(lang):
             await interaction.response.send_message(
-                f"Language **{lang}** is not available. Available: {', '.join(available) or 'en'}",
+                f"Language **{lang}** is not available. Available: {', '.join(available_locales()) or 'en'}",
                 ephemeral=True,
             )
             return
         gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
         gq.locale = lang
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         await interaction.response.send_message(f"Language set to **{lang}**.")
 
     # ── crossfade ────────────────────────────────────────────────────────
 
     @app_commands.command(name="crossfade", description="Set crossfade duration between tracks (0-10 seconds)")
     @app_commands.describe(seconds="Crossfade duration in seconds (0 to disable)")
-    async def crossfade(self, interaction: discord.Interaction, seconds: int) -> None:
-        gq = self.queues.get(interaction.guild.id)  # type: ignore[union-attr]
-        if err := _check_dj(interaction, gq):
-            await interaction.response.send_message(err, ephemeral=True)
-            return
+    @_require_dj
+    async def crossfade(self, interaction: discord.Interaction, gq: GuildQueue, seconds: int) -> None:
         if not 0 <= seconds <= 10:
             await interaction.response.send_message("Must be 0-10 seconds.", ephemeral=True)
             return
         gq.crossfade_seconds = seconds
-        self.queues.save_settings()
+        self._schedule_settings_save(interaction.guild.id)  # type: ignore[union-attr]
         if seconds == 0:
             self._cancel_crossfade_timer(interaction.guild.id)  # type: ignore[union-attr]
             await interaction.response.send_message("🎵 Crossfade disabled.")
@@ -3295,7 +3742,8 @@ class MusicCog(commands.Cog):
         after: discord.VoiceState,
     ) -> None:
         """Auto-disconnect when alone + join notification."""
-        if member.bot:
+        # Same-channel updates (mute, deafen, stream) are neither joins nor leaves
+        if member.bot or before.channel == after.channel:
             return
 
         vc: Optional[discord.VoiceClient] = member.guild.voice_client  # type: ignore[assignment]
@@ -3303,14 +3751,9 @@ class MusicCog(commands.Cog):
             return
 
         # Join notification: user joined the bot's VC
-        joined_bot_vc = (
-            after.channel is not None
-            and after.channel == vc.channel
-            and (before.channel is None or before.channel != after.channel)
-        )
-        if joined_bot_vc:
+        if after.channel is not None and after.channel == vc.channel and vc.is_playing():
             gq = self.queues.get(member.guild.id)
-            if gq.current and gq.text_channel_id and vc.is_playing():
+            if gq.current and gq.text_channel_id:
                 channel = member.guild.get_channel(gq.text_channel_id)
                 if channel and hasattr(channel, "send"):
                     track = gq.current
@@ -3318,7 +3761,7 @@ class MusicCog(commands.Cog):
                     embed = discord.Embed(
                         title="Now Playing",
                         description=f"**{track.title}**\n{progress_bar(elapsed, track.duration)}",
-                        color=discord.Color.green(),
+                        color=_COLOR_GREEN,
                     )
                     if track.thumbnail:
                         embed.set_thumbnail(url=track.thumbnail)
@@ -3334,14 +3777,16 @@ class MusicCog(commands.Cog):
         if vc.channel != before.channel:
             return
 
-        non_bot_members = [m for m in before.channel.members if not m.bot]
-        if len(non_bot_members) == 0:
+        if not any(not m.bot for m in before.channel.members):
             gq = self.queues.get(member.guild.id)
             if gq.stay_connected:
                 return
             gq.clear()
+            self._cancel_save(member.guild.id)
             self.queues.clear_queue_state(member.guild.id)
             self._cancel_crossfade_timer(member.guild.id)
+            self._cancel_prefetch(member.guild.id)
+            self._stream_sources.pop(member.guild.id, None)
             self._cleanup_player(member.guild.id)
             vc.stop()
             await vc.disconnect()
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import struct
+import threading
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 import discord
@@ -23,6 +26,34 @@ YTDL_OPTIONS = {
     "js_runtimes": {"node": {}},
 }
 
+# Option sets for the YoutubeDL instances reused by ytdl_extract()
+_YTDL_PROFILES: dict[str, dict] = {
+    "default": YTDL_OPTIONS,
+    "search": {**YTDL_OPTIONS, "extract_flat": "in_playlist"},
+    "playlist": {
+        **YTDL_OPTIONS,
+        "noplaylist": False,
+        "extract_flat": "in_playlist",
+        "extractor_args": {"youtubetab": {"skip": ["authcheck"]}},
+    },
+    "soundcloud": {**YTDL_OPTIONS, "noplaylist": False, "extract_flat": "in_playlist"},
+}
+_ytdl_local = threading.local()
+
+
+def ytdl_extract(query: str, profile: str = "default") -> dict:
+    """Blocking yt-dlp lookup; run it in an executor.
+
+    Building a YoutubeDL loads every extractor, so each worker thread keeps one
+    per profile instead of constructing it per call (instances aren't thread-safe).
+    """
+    ytdl = getattr(_ytdl_local, profile, None)
+    if ytdl is None:
+        ytdl = yt_dlp.YoutubeDL(_YTDL_PROFILES[profile])
+        setattr(_ytdl_local, profile, ytdl)
+    return ytdl.extract_info(query, download=False)
+
+
 FFMPEG_OPTIONS = {
     "before_options": (
         "-reconnect 1 -reconnect_streamed 1 -reconnect_on_network_error 1"
@@ -47,16 +78,16 @@ EQ_BANDS = [
     ("8kHz", 8000), ("16kHz", 16000),
 ]
 
-EQ_PRESETS: dict[str, list[float]] = {
-    "flat": [0.0] * 10,
-    "bass_heavy": [6, 5, 4, 2, 0, 0, 0, 0, 0, 0],
-    "treble_heavy": [0, 0, 0, 0, 0, 0, 2, 4, 5, 6],
-    "vocal": [-2, -1, 0, 2, 4, 4, 2, 0, -1, -2],
-    "electronic": [4, 3, 0, -2, -1, 0, 2, 3, 4, 5],
+EQ_PRESETS: dict[str, tuple[float, ...]] = {
+    "flat": (0.0,) * 10,
+    "bass_heavy": (6, 5, 4, 2, 0, 0, 0, 0, 0, 0),
+    "treble_heavy": (0, 0, 0, 0, 0, 0, 2, 4, 5, 6),
+    "vocal": (-2, -1, 0, 2, 4, 4, 2, 0, -1, -2),
+    "electronic": (4, 3, 0, -2, -1, 0, 2, 3, 4, 5),
 }
 
 
-def build_eq_filter(bands: list[float]) -> str:
+def _render_eq_filter(bands: Sequence[float]) -> str:
     parts = []
     for i, (_, freq) in enumerate(EQ_BANDS):
         gain = max(-12.0, min(12.0, bands[i]))
@@ -65,7 +96,45 @@ def build_eq_filter(bands: list[float]) -> str:
     return ",".join(parts) if parts else ""
 
 
-@dataclass
+PRESET_FILTERS: dict[str, str] = {
+    name: _render_eq_filter(bands) for name, bands in EQ_PRESETS.items()
+}
+_PRESET_FILTERS_BY_BANDS: dict[tuple[float, ...], str] = {
+    EQ_PRESETS[name]: f for name, f in PRESET_FILTERS.items()
+}
+
+
+def build_eq_filter(bands: Sequence[float]) -> str:
+    """ffmpeg equalizer chain for the given gains; presets are looked up, not rebuilt."""
+    preset = _PRESET_FILTERS_BY_BANDS.get(tuple(bands))
+    if preset is not None:
+        return preset
+    return _render_eq_filter(bands)
+
+
+@functools.lru_cache(maxsize=128)
+def _audio_filter_chain(
+    filter_name: str | None,
+    speed: float,
+    normalize: bool,
+    eq_bands: tuple[float, ...] | None,
+) -> str:
+    """The ffmpeg -af graph for a guild's audio settings; the same few combinations recur."""
+    af_parts: list[str] = []
+    if filter_name and filter_name in AUDIO_FILTERS:
+        af_parts.append(AUDIO_FILTERS[filter_name])
+    if speed != 1.0:
+        af_parts.append(f"atempo={speed}")
+    if normalize:
+        af_parts.append("loudnorm=I=-16:TP=-1.5:LRA=11")
+    if eq_bands and any(g != 0.0 for g in eq_bands):
+        eq_str = build_eq_filter(eq_bands)
+        if eq_str:
+            af_parts.append(eq_str)
+    return ",".join(af_parts)
+
+
+@dataclass(slots=True)
 class TrackInfo:
     """Lightweight metadata stored in the queue — resolved to a source just-in-time."""
 
@@ -109,14 +178,21 @@ class YTDLSource(discord.PCMVolumeTransformer):
         seek_seconds: int = 0,
         speed: float = 1.0,
         normalize: bool = False,
-        eq_bands: list[float] | None = None,
+        eq_bands: Sequence[float] | None = None,
         is_live: bool = False,
     ) -> YTDLSource:
         """Create a playable source from a URL or search query."""
-        ytdl = yt_dlp.YoutubeDL(YTDL_OPTIONS)
-        data = await loop.run_in_executor(
-            None, lambda: ytdl.extract_info(query, download=False)
-        )
+        data = await cls.extract(query, loop=loop)
+        url = data["url"]
+        return cls._build(url, data=data, volume=volume,
+                          filter_name=filter_name, seek_seconds=seek_seconds,
+                          speed=speed, normalize=normalize,
+                          eq_bands=eq_bands, is_live=is_live)
+
+    @staticmethod
+    async def extract(query: str, *, loop: asyncio.AbstractEventLoop) -> dict:
+        """Resolve a URL or search query to yt-dlp info, including the stream URL."""
+        data = await loop.run_in_executor(None, ytdl_extract, query)
 
         if data is None:
             raise ValueError("No results found")
@@ -124,12 +200,7 @@ class YTDLSource(discord.PCMVolumeTransformer):
             if not data["entries"]:
                 raise ValueError("No results found")
             data = data["entries"][0]
-
-        url = data["url"]
-        return cls._build(url, data=data, volume=volume,
-                          filter_name=filter_name, seek_seconds=seek_seconds,
-                          speed=speed, normalize=normalize,
-                          eq_bands=eq_bands, is_live=is_live)
+        return data
 
     @classmethod
     def from_stream_url(
@@ -142,7 +213,7 @@ class YTDLSource(discord.PCMVolumeTransformer):
         seek_seconds: int = 0,
         speed: float = 1.0,
         normalize: bool = False,
-        eq_bands: list[float] | None = None,
+        eq_bands: Sequence[float] | None = None,
         is_live: bool = False,
     ) -> YTDLSource:
         """Rebuild an FFmpeg source from a cached stream URL (no yt-dlp fetch)."""
@@ -162,7 +233,7 @@ class YTDLSource(discord.PCMVolumeTransformer):
         seek_seconds: int,
         speed: float = 1.0,
         normalize: bool = False,
-        eq_bands: list[float] | None = None,
+        eq_bands: Sequence[float] | None = None,
         is_live: bool = False,
     ) -> YTDLSource:
         before = FFMPEG_OPTIONS["before_options"]
@@ -177,19 +248,11 @@ class YTDLSource(discord.PCMVolumeTransformer):
         elif seek_seconds > 0:
             before = f"-ss {seek_seconds} " + before
 
-        af_parts: list[str] = []
-        if filter_name and filter_name in AUDIO_FILTERS:
-            af_parts.append(AUDIO_FILTERS[filter_name])
-        if speed != 1.0:
-            af_parts.append(f"atempo={speed}")
-        if normalize:
-            af_parts.append("loudnorm=I=-16:TP=-1.5:LRA=11")
-        if eq_bands and any(g != 0.0 for g in eq_bands):
-            eq_str = build_eq_filter(eq_bands)
-            if eq_str:
-                af_parts.append(eq_str)
-        if af_parts:
-            opts = opts + " -af " + ",".join(af_parts)
+        af = _audio_filter_chain(
+            filter_name, speed, normalize, tuple(eq_bands) if eq_bands else None
+        )
+        if af:
+            opts = opts + " -af " + af
 
         source = discord.FFmpegPCMAudio(
             stream_url, before_options=before, options=opts
@@ -201,13 +264,8 @@ class YTDLSource(discord.PCMVolumeTransformer):
         query: str, *, loop: asyncio.AbstractEventLoop, limit: int = 5
     ) -> list[TrackInfo]:
         """Search YouTube and return lightweight TrackInfo results."""
-        opts = {**YTDL_OPTIONS, "noplaylist": True, "extract_flat": "in_playlist"}
-        ytdl = yt_dlp.YoutubeDL(opts)
-
         search_query = f"ytsearch{limit * 2}:{query}"
-        data = await loop.run_in_executor(
-            None, lambda: ytdl.extract_info(search_query, download=False)
-        )
+        data = await loop.run_in_executor(None, ytdl_extract, search_query, "search")
 
         results: list[TrackInfo] = []
         for entry in data.get("entries", []) or []:
@@ -0,0 +1,58 @@
+"""Small in-process caches shared by the resolvers and the cog."""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class TTLCache:
+    """Small thread-safe LRU whose entries expire after ``ttl`` seconds.
+
+    Lookups run in executor threads, so access is guarded by a lock.
+    """
+
+    _MISS = object()
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the live value for *key*, or None on a miss."""
+        with self._lock:
+            hit = self._data.get(key, self._MISS)
+            if hit is self._MISS or hit[0] <= time.monotonic():
+                return None
+            self._data.move_to_end(key)
+            return hit[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value for *key*, calling *fetch* on a miss.
+
+        Only truthy results are stored: None or an empty result usually means a
+        failed or rate-limited lookup, and caching it would pin that miss for the
+        whole TTL.
+        """
+        now = time.monotonic()
+        with self._lock:
+            hit = self._data.get(key, self._MISS)
+            if hit is not self._MISS and hit[0] > now:
+                self._data.move_to_end(key)
+                return hit[1]
+        # Fetch outside the lock so one slow API call doesn't stall other lookups
+        value = fetch()
+        if value:
+            self.put(key, value)
+        return value
@@ -14,12 +14,15 @@ from pathlib import Path
 log = logging.getLogger(__name__)
 
 _locales: dict[str, dict[str, str]] = {}
+_locale_names: tuple[str, ...] = ()  # sorted, refreshed by load_locales()
 _LOCALE_DIR = Path(__file__).resolve().parent.parent / "locales"
 
 
 def load_locales() -> None:
     """Load all locale JSON files from the locales/ directory."""
+    global _locale_names
     _locales.clear()
+    _locale_names = ()
     if not _LOCALE_DIR.is_dir():
         log.warning("Locales directory not found: %s", _LOCALE_DIR)
         return
@@ -31,10 +34,15 @@ def load_locales() -> None:
             log.info("Loaded locale: %s (%d keys)", lang, len(data))
         except Exception as exc:
             log.warning("Failed to load locale %s: %s", lang, exc)
+    _locale_names = tuple(sorted(_locales))
 
 
-def available_locales() -> list[str]:
-    return sorted(_locales.keys())
+def available_locales() -> tuple[str, ...]:
+    return _locale_names
+
+
+def has_locale(lang: str) -> bool:
+    return lang in _locales
 
 
 def t(key: str, locale: str = "en", **kwargs) -> str:
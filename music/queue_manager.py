@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 import json
 import logging
 import os
 import random
 import re
+import threading
+import time
 from collections import Counter, deque
+from collections.abc import Iterable, Iterator
 from enum import Enum, auto
+from itertools import islice
 from pathlib import Path
 
 from .audio_source import TrackInfo
@@ -52,6 +58,39 @@ class LoopMode(Enum):
         }[self]
 
 
+class RadioHistory:
+    """Spotify track IDs already played by radio, keeping only the newest *maxlen*."""
+
+    def __init__(self, maxlen: int = 200) -> None:
+        self._order: deque[str] = deque(maxlen=maxlen)
+        self._ids: set[str] = set()
+
+    def add(self, track_id: str) -> None:
+        if track_id in self._ids:
+            return
+        if len(self._order) == self._order.maxlen:
+            self._ids.discard(self._order[0])  # about to fall off the deque
+        self._order.append(track_id)
+        self._ids.add(track_id)
+
+    def update(self, track_ids: Iterable[str]) -> None:
+        for tid in track_ids:
+            self.add(tid)
+
+    def clear(self) -> None:
+        self._order.clear()
+        self._ids.clear()
+
+    def __contains__(self, track_id: object) -> bool:
+        return track_id in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._order)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
 class GuildQueue:
     """Per-guild playback state."""
 
@@ -62,7 +101,7 @@ class GuildQueue:
         self.volume: float = 0.5
         self.search_mode: str = "youtube"
         self.max_queue: int = 50
-        self.play_start_time: float = 0.0
+        self.play_start_time: float = 0.0  # time.monotonic() at track position 0
         self.autoplay: bool = False
         self.filter_name: str | None = None
         self.previous: TrackInfo | None = None
@@ -73,14 +112,20 @@ class GuildQueue:
         self.text_channel_id: int | None = None
         self._restarting: bool = False
         self.skip_votes: set[int] = set()
+        # user_id → (expires_at, dj_role_id, verdict); runtime-only cache for _check_dj
+        self.dj_cache: dict[int, tuple[float, int | None, str | None]] = {}
 
         # EQ
-        self.eq_bands: list[float] = [0.0] * 10
+        self._eq_bands: tuple[float, ...] = (0.0,) * 10
+        self._eq_active = False
 
         # Radio mode
         self.radio_mode: bool = False
         self.radio_seed: str | None = None
-        self.radio_history: set[str] = set()
+        self.radio_history: RadioHistory = RadioHistory()
+        # Fetched but not yet queued recommendations (spotify_id, track)
+        self.radio_buffer: deque[tuple[str, TrackInfo]] = deque()
+        self.radio_lock: asyncio.Lock = asyncio.Lock()  # one recommendation fetch at a time
 
         # DJ queue mode
         self.dj_queue_mode: bool = False
@@ -102,13 +147,107 @@ class GuildQueue:
         # Per-user queue limit (0 = unlimited)
         self.max_per_user: int = 0
 
+        # Queued tracks per requester and per URL, and their total duration,
+        # kept in step with self.queue so the per-user limit check, duplicate
+        # check and queue footer don't rescan it. Tracks restored from older
+        # state have no requester_id and are counted by display name.
+        self._user_counts: Counter[int] = Counter()
+        self._name_counts: Counter[str] = Counter()
+        self._url_counts: Counter[str] = Counter()
+        self._total_duration: int = 0
+
+    def _count(self, track: TrackInfo, delta: int = 1) -> None:
+        if track.requester_id:
+            self._user_counts[track.requester_id] += delta
+        else:
+            self._name_counts[track.requester] += delta
+        self._url_counts[track.url] += delta
+        if self._url_counts[track.url] <= 0:
+            del self._url_counts[track.url]
+        self._total_duration += track.duration * delta
+
+    def _recount(self) -> None:
+        """Rebuild the per-requester counters after the queue was replaced wholesale."""
+        self._user_counts.clear()
+        self._name_counts.clear()
+        self._url_counts.clear()
+        self._total_duration = 0
+        for t in self.queue:
+            self._count(t)
+
+    @property
+    def total_duration(self) -> int:
+        """Combined duration of the queued tracks in seconds."""
+        return self._total_duration
+
+    @property
+    def eq_bands(self) -> tuple[float, ...]:
+        return self._eq_bands
+
+    @eq_bands.setter
+    def eq_bands(self, bands: Iterable[float]) -> None:
+        self._eq_bands = tuple(bands)
+        self._eq_active = any(g != 0 for g in self._eq_bands)
+
+    def set_eq_band(self, index: int, gain: float) -> None:
+        """Set one band's gain (0-based index)."""
+        bands = list(self._eq_bands)
+        bands[index] = gain
+        self.eq_bands = bands
+
+    @property
+    def eq_active(self) -> bool:
+        """Whether any EQ band is non-zero, kept in step with eq_bands."""
+        return self._eq_active
+
+    def per_user_count(self, user_id: int, display_name: str) -> int:
+        """Number of queued tracks requested by this user."""
+        return self._user_counts[user_id] + self._name_counts[display_name]
+
+    def room_for(self, user_id: int, display_name: str, wanted: int) -> tuple[int, str]:
+        """How many of *wanted* tracks this user can queue now, and why the rest won't fit."""
+        take = min(wanted, max(0, self.max_queue - len(self.queue)))
+        if self.max_per_user > 0:
+            user_room = max(0, self.max_per_user - self.per_user_count(user_id, display_name))
+            if user_room < take:
+                return user_room, f"per-user limit of {self.max_per_user}"
+        return take, "queue full"
+
     def add(self, track: TrackInfo) -> int | None:
         """Add a track and return its position (1-indexed), or None if queue is full."""
         if len(self.queue) >= self.max_queue:
             return None
         self.queue.append(track)
+        self._count(track)
         return len(self.queue)
 
+    def extend(self, tracks: Iterable[TrackInfo]) -> int:
+        """Add tracks until the queue is full; returns how many were added."""
+        added = list(islice(tracks, max(0, self.max_queue - len(self.queue))))
+        self.queue.extend(added)
+        for track in added:
+            self._count(track)
+        return len(added)
+
+    def push_front(self, track: TrackInfo) -> None:
+        """Put a track at the head of the queue, bypassing the size limit."""
+        self.queue.appendleft(track)
+        self._count(track)
+
+    def pop_front(self) -> TrackInfo:
+        """Remove and return the track at the head of the queue."""
+        track = self.queue.popleft()
+        self._count(track, -1)
+        return track
+
+    def clear_queue(self) -> None:
+        """Drop all upcoming tracks, leaving playback state untouched."""
+        self.queue.clear()
+        self._user_counts.clear()
+        self._name_counts.clear()
+        self._url_counts.clear()
+        self._total_duration = 0
+
     def next_track(self) -> TrackInfo | None:
         """Advance the queue respecting loop mode. Returns the next TrackInfo or None."""
         self.skip_votes.clear()
@@ -119,12 +258,13 @@ class GuildQueue:
 
         if self.loop_mode == LoopMode.QUEUE and self.current is not None:
             self.queue.append(self.current)
+            self._count(self.current)
 
         if not self.queue:
             self.current = None
             return None
 
-        self.current = self.queue.popleft()
+        self.current = self.pop_front()
         return self.current
 
     def remove_at(self, index: int) -> TrackInfo | None:
@@ -134,6 +274,7 @@ class GuildQueue:
         items = list(self.queue)
         removed = items.pop(index)
         self.queue = deque(items)
+        self._count(removed, -1)
         return removed
 
     def move(self, from_idx: int, to_idx: int) -> TrackInfo | None:
@@ -152,6 +293,8 @@ class GuildQueue:
         if index < 0 or index >= len(self.queue):
             return None
         items = list(self.queue)
+        for t in items[:index]:
+            self._count(t, -1)
         self.queue = deque(items[index:])
         return self.queue[0]
 
@@ -176,28 +319,23 @@ class GuildQueue:
         for g in groups.values():
             random.shuffle(g)
 
-        # Interleave: always pick from the largest group that differs from the last
+        # Interleave: always pick from the largest group that differs from the last.
+        # A max-heap of (-remaining, order, artist) keeps each pick O(log groups);
+        # the order index breaks ties the same way as scanning groups in order.
+        heap = [(-len(g), i, k) for i, (k, g) in enumerate(groups.items())]
+        heapq.heapify(heap)
         result: list[TrackInfo] = []
         last_artist = ""
-        remaining = {k: deque(v) for k, v in groups.items()}
-
-        while remaining:
-            # Find candidate groups (different from last artist)
-            candidates = {k: v for k, v in remaining.items() if k != last_artist and v}
-            if not candidates:
-                # Forced to pick from same artist (only one group left)
-                candidates = {k: v for k, v in remaining.items() if v}
-            if not candidates:
-                break
-
-            # Pick from largest group
-            best_key = max(candidates, key=lambda k: len(candidates[k]))
-            track = remaining[best_key].popleft()
-            result.append(track)
-            last_artist = best_key
-
-            if not remaining[best_key]:
-                del remaining[best_key]
+        while heap:
+            entry = heapq.heappop(heap)
+            if entry[2] == last_artist and heap:
+                # Same artist as the last pick: take the runner-up, put this group back
+                entry = heapq.heapreplace(heap, entry)
+            neg, i, artist = entry
+            result.append(groups[artist].pop())
+            if neg < -1:
+                heapq.heappush(heap, (neg + 1, i, artist))
+            last_artist = artist
 
         self.queue = deque(result)
 
@@ -205,16 +343,17 @@ class GuildQueue:
         """Check if a track URL is already in the queue or currently playing."""
         if self.current and self.current.url == track.url:
             return True
-        return any(t.url == track.url for t in self.queue)
+        return track.url in self._url_counts
 
     def clear(self) -> None:
-        self.queue.clear()
+        self.clear_queue()
         self.current = None
         self.previous = None
         self.loop_mode = LoopMode.OFF
         self.radio_mode = False
         self.radio_seed = None
         self.radio_history.clear()
+        self.radio_buffer.clear()
         self.skip_votes.clear()
         self.pending_requests.clear()
         self.play_start_time = 0.0
@@ -236,6 +375,7 @@ class GuildQueue:
             return None
         items, description = self._undo_stack.pop()
         self.queue = deque(items)
+        self._recount()
         return description
 
 
@@ -253,9 +393,11 @@ class QueueManager:
         self._guilds: dict[int, GuildQueue] = {}
         self._settings_path = Path(settings_path)
         self._settings: dict[str, dict] = {}
+        self._settings_lock = threading.Lock()
         self._load_settings()
         self._queue_state_path = Path("/data/queue_state.json")
         self._queue_state: dict[str, dict] = {}
+        self._queue_state_lock = threading.Lock()
         if self._queue_state_path.exists():
             try:
                 self._queue_state = json.loads(self._queue_state_path.read_text())
@@ -269,15 +411,33 @@ class QueueManager:
             except Exception as exc:
                 log.warning("Failed to load settings: %s", exc)
 
-    def save_settings(self) -> None:
-        for guild_id, gq in self._guilds.items():
+    def save_settings(self, guild_id: int | None = None, *, write: bool = True) -> None:
+        """Persist guild settings. Pass the guild that changed to skip re-reading the others.
+
+        With ``write=False`` only the in-memory snapshot is updated; call
+        :meth:`write_settings` (e.g. from an executor) to flush it.
+        """
+        if guild_id is not None and guild_id in self._guilds:
+            changed = {guild_id: self._guilds[guild_id]}
+        else:
+            changed = self._guilds
+        for gid, gq in changed.items():
             data = {k: getattr(gq, k) for k in _SETTINGS_KEYS}
             data["loop_mode"] = gq.loop_mode.name
-            self._settings[str(guild_id)] = data
-        _atomic_write(self._settings_path, self._settings)
+            data["eq_bands"] = list(gq.eq_bands)
+            self._settings[str(gid)] = data
+        if write:
+            self.write_settings()
+
+    def write_settings(self) -> None:
+        """Write the settings snapshot to disk. Safe to call from a worker thread."""
+        # Copy under the lock so an older snapshot can never be written after a newer one
+        with self._settings_lock:
+            _atomic_write(self._settings_path, dict(self._settings))
 
     def get(self, guild_id: int) -> GuildQueue:
-        if guild_id not in self._guilds:
+        gq = self._guilds.get(guild_id)
+        if gq is None:
             gq = GuildQueue()
             saved = self._settings.get(str(guild_id))
             if saved:
@@ -298,13 +458,18 @@ class QueueManager:
                             setattr(gq, k, saved[k])
             self._restore_queue_state(guild_id, gq)
             self._guilds[guild_id] = gq
-        return self._guilds[guild_id]
+        return gq
+
+    def save_queue_state(self, guild_id: int, *, write: bool = True) -> bool:
+        """Persist current track + queue to disk for crash recovery.
 
-    def save_queue_state(self, guild_id: int) -> None:
-        """Persist current track + queue to disk for crash recovery."""
+        With ``write=False`` only the in-memory snapshot is updated; call
+        :meth:`write_queue_state` (e.g. from an executor) to flush it.
+        Returns False if the guild has no queue.
+        """
         gq = self._guilds.get(guild_id)
         if gq is None:
-            return
+            return False
         key = str(guild_id)
 
         def _track_dict(t: TrackInfo) -> dict:
@@ -315,21 +480,27 @@ class QueueManager:
                        "loop_mode": gq.loop_mode.name}
         if gq.current:
             state["current"] = _track_dict(gq.current)
-            import time
-            elapsed = int((time.time() - gq.play_start_time) * gq.speed) if gq.play_start_time else 0
+            elapsed = int((time.monotonic() - gq.play_start_time) * gq.speed) if gq.play_start_time else 0
             state["elapsed"] = elapsed
         self._queue_state[key] = state
-        self._write_queue_state()
+        if write:
+            self.write_queue_state()
+        return True
 
     def clear_queue_state(self, guild_id: int) -> None:
         """Remove saved queue state (called on /stop and auto-disconnect)."""
         key = str(guild_id)
         if key in self._queue_state:
             del self._queue_state[key]
-            self._write_queue_state()
+            self.write_queue_state()
 
-    def _write_queue_state(self) -> None:
-        _atomic_write(self._queue_state_path, self._queue_state)
+    def write_queue_state(self) -> None:
+        """Write the queue-state snapshot to disk. Safe to call from a worker thread."""
+        # Per-guild entries are replaced, never mutated, so a shallow copy is a
+        # consistent snapshot. Take it under the lock so a writer holding an older
+        # copy can't land after a newer write (e.g. resurrect a cleared queue).
+        with self._queue_state_lock:
+            _atomic_write(self._queue_state_path, dict(self._queue_state))
 
     def _restore_queue_state(self, guild_id: int, gq: GuildQueue) -> None:
         """Restore saved queue into a freshly created GuildQueue."""
@@ -347,6 +518,7 @@ class QueueManager:
                 title=d["title"], url=d["url"], duration=d.get("duration", 0),
                 thumbnail=d.get("thumbnail", ""), requester=d.get("requester", ""),
             ))
+        gq._recount()
         if "loop_mode" in saved:
             try:
                 gq.loop_mode = LoopMode[saved["loop_mode"]]
@@ -358,19 +530,28 @@ class QueueManager:
 
 
 class HistoryManager:
-    """Tracks play history per guild, capped at 500 entries."""
+    """Tracks play history per guild, capped at 500 entries.
+
+    ``record(..., write=False)`` followed by :meth:`write` from an executor keeps
+    the JSON dump off the event loop; the lock serializes concurrent writers.
+    """
 
     def __init__(self, path: str = "/data/history.json") -> None:
         self._path = Path(path)
         self._data: dict[str, list[dict]] = {}
+        # (guild key, limit) → last top() result; dropped when the guild records a play
+        self._top_cache: dict[tuple[str, int], list[tuple[str, str, int]]] = {}
+        self._lock = threading.Lock()
         if self._path.exists():
             try:
                 self._data = json.loads(self._path.read_text())
             except Exception as exc:
                 log.warning("Failed to load history: %s", exc)
 
-    def _save(self) -> None:
-        _atomic_write(self._path, self._data)
+    def write(self) -> None:
+        """Write history to disk. Safe to call from a worker thread."""
+        with self._lock:
+            _atomic_write(self._path, dict(self._data))
 
     def record(
         self,
@@ -378,9 +559,9 @@ class HistoryManager:
         track: TrackInfo,
         requester_id: int = 0,
         duration: int = 0,
+        *,
+        write: bool = True,
     ) -> None:
-        import time
-
         key = str(guild_id)
         entries = self._data.setdefault(key, [])
         entry: dict = {"title": track.title, "url": track.url, "ts": time.time()}
@@ -391,18 +572,26 @@ class HistoryManager:
         entries.append(entry)
         if len(entries) > 500:
             self._data[key] = entries[-500:]
-        self._save()
+        for cache_key in [k for k in self._top_cache if k[0] == key]:
+            del self._top_cache[cache_key]
+        if write:
+            self.write()
 
     def top(self, guild_id: int, limit: int = 10) -> list[tuple[str, str, int]]:
         """Return top tracks as (title, url, count) sorted by play count."""
-        entries = self._data.get(str(guild_id), [])
+        key = str(guild_id)
+        cached = self._top_cache.get((key, limit))
+        if cached is not None:
+            return cached
+        entries = self._data.get(key, [])
         counts: Counter[str] = Counter()
         url_map: dict[str, str] = {}
         for e in entries:
             title = e.get("title", "Unknown")
             counts[title] += 1
             url_map[title] = e.get("url", "")
-        return [(t, url_map[t], c) for t, c in counts.most_common(limit)]
+        top = self._top_cache[(key, limit)] = [(t, url_map[t], c) for t, c in counts.most_common(limit)]
+        return top
 
     def user_stats(self, guild_id: int, user_id: int) -> dict:
         """Return stats for a specific user in a guild."""
@@ -448,11 +637,16 @@ class HistoryManager:
 
 
 class FavoritesManager:
-    """Per-user favorites, max 50 per user."""
+    """Per-user favorites, max 50 per user.
+
+    ``add`` and ``remove`` are safe to run from an executor thread; the lock
+    keeps concurrent writers from interleaving mutations with serialization.
+    """
 
     def __init__(self, path: str = "/data/favorites.json") -> None:
         self._path = Path(path)
         self._data: dict[str, list[dict]] = {}
+        self._lock = threading.Lock()
         if self._path.exists():
             try:
                 self._data = json.loads(self._path.read_text())
@@ -465,29 +659,31 @@ class FavoritesManager:
     def add(self, user_id: int, track: TrackInfo, guild_id: int = 0) -> bool:
         """Add a track. Returns False if already at max or duplicate."""
         key = str(user_id)
-        favs = self._data.setdefault(key, [])
-        if len(favs) >= 50:
-            return False
-        if any(f["url"] == track.url for f in favs):
-            return False
-        favs.append({
-            "title": track.title,
-            "url": track.url,
-            "duration": track.duration,
-            "thumbnail": track.thumbnail,
-            "guild_id": guild_id,
-        })
-        self._save()
+        with self._lock:
+            favs = self._data.setdefault(key, [])
+            if len(favs) >= 50:
+                return False
+            if any(f["url"] == track.url for f in favs):
+                return False
+            favs.append({
+                "title": track.title,
+                "url": track.url,
+                "duration": track.duration,
+                "thumbnail": track.thumbnail,
+                "guild_id": guild_id,
+            })
+            self._save()
         return True
 
     def remove(self, user_id: int, index: int) -> dict | None:
         """Remove by 0-based index. Returns the removed entry or None."""
         key = str(user_id)
-        favs = self._data.get(key, [])
-        if index < 0 or index >= len(favs):
-            return None
-        removed = favs.pop(index)
-        self._save()
+        with self._lock:
+            favs = self._data.get(key, [])
+            if index < 0 or index >= len(favs):
+                return None
+            removed = favs.pop(index)
+            self._save()
         return removed
 
     def list(self, user_id: int) -> list[dict]:
@@ -555,11 +751,9 @@ class PlaylistManager:
         return guild_pls.get(name.lower())
 
     def save(
-        self, guild_id: int, name: str, tracks: list[TrackInfo], created_by: str
+        self, guild_id: int, name: str, tracks: Iterable[TrackInfo], created_by: str
     ) -> str | None:
-        """Save a playlist. Returns error message or None on success."""
-        import time as _time
-
+        """Save a playlist from any iterable of tracks. Returns error message or None on success."""
         key = str(guild_id)
         guild_pls = self._data.setdefault(key, {})
         name_key = name.lower()
@@ -568,14 +762,14 @@ class PlaylistManager:
         track_list = [
             {"title": t.title, "url": t.url, "duration": t.duration,
              "thumbnail": t.thumbnail}
-            for t in tracks[:self.MAX_TRACKS]
+            for t in islice(tracks, self.MAX_TRACKS)
         ]
         existing = guild_pls.get(name_key, {})
         guild_pls[name_key] = {
             "name": name,
             "tracks": track_list,
             "created_by": created_by,
-            "created_at": _time.time(),
+            "created_at": time.time(),
             "collaborators": existing.get("collaborators", []),
         }
         self._write()
@@ -2,15 +2,22 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Iterable
+from dataclasses import replace
 
 import spotipy
 from spotipy.oauth2 import SpotifyClientCredentials
 
 from .audio_source import TrackInfo
+from .cache import TTLCache
 
 log = logging.getLogger(__name__)
 
 
+def _norm(query: str) -> str:
+    return " ".join(query.casefold().split())
+
+
 class SpotifyResolver:
     """Resolves Spotify URLs to 'Artist - Title' strings for YouTube search."""
 
@@ -26,6 +33,10 @@ class SpotifyResolver:
             client_id=client_id, client_secret=client_secret
         )
         self._sp = spotipy.Spotify(auth_manager=auth)
+        # Related-artist lookups back /similar, /radio and autoplay, and the
+        # same tracks, playlists and albums get queued over and over; popular
+        # keys repeat across guilds, so keep API results for a while.
+        self._cache = TTLCache(maxsize=1024, ttl=1800)
 
     @property
     def available(self) -> bool:
@@ -67,6 +78,9 @@ class SpotifyResolver:
         """Search for a track or artist and return an artist ID."""
         if not self._sp:
             return None
+        return self._cache.get_or_fetch(("artist_id", _norm(query)), lambda: self._lookup_artist_id(query))
+
+    def _lookup_artist_id(self, query: str) -> str | None:
         # Try track search first (works best for "Artist - Title" queries)
         results = self._sp.search(q=query, type="track", limit=1)
         items = results.get("tracks", {}).get("items", [])
@@ -84,7 +98,9 @@ class SpotifyResolver:
     ) -> list[tuple[str, TrackInfo]]:
         """Get top tracks from related artists, skipping exclude_ids."""
         try:
-            related = self._sp.artist_related_artists(artist_id)
+            related = self._cache.get_or_fetch(
+                ("related", artist_id), lambda: self._sp.artist_related_artists(artist_id)
+            )
         except Exception as exc:
             log.warning("Spotify related artists failed: %s", exc)
             return []
@@ -93,7 +109,9 @@ class SpotifyResolver:
             if len(out) >= limit:
                 break
             try:
-                top = self._sp.artist_top_tracks(artist["id"])
+                top = self._cache.get_or_fetch(
+                    ("top", artist["id"]), lambda: self._sp.artist_top_tracks(artist["id"])
+                )
             except Exception:
                 continue
             for track in top.get("tracks", []):
@@ -113,6 +131,11 @@ class SpotifyResolver:
         """Find a similar track via related artists."""
         if not self._sp:
             return None
+        rec = self._cache.get_or_fetch(("recommend", _norm(query)), lambda: self._lookup_recommend(query))
+        # Hand out a copy; the cog stamps requester fields on queued tracks
+        return replace(rec) if rec else None
+
+    def _lookup_recommend(self, query: str) -> TrackInfo | None:
         artist_id = self._get_artist_id(query)
         if not artist_id:
             return None
@@ -130,7 +153,7 @@ class SpotifyResolver:
         return [info for _, info in results]
 
     def recommend_by_seed(
-        self, seed: str, exclude_ids: set[str] | None = None, limit: int = 5
+        self, seed: str, exclude_ids: Iterable[str] | None = None, limit: int = 5
     ) -> list[tuple[str, TrackInfo]]:
         """Get similar tracks seeded by artist or track name.
 
@@ -138,28 +161,30 @@ class SpotifyResolver:
         """
         if not self._sp:
             return []
-        exclude_ids = set(exclude_ids) if exclude_ids else set()
+        exclude_ids = set(exclude_ids or ())
+        artist_id = self._cache.get_or_fetch(("seed", _norm(seed)), lambda: self._lookup_seed_artist(seed))
+        if not artist_id:
+            return []
+        return self._related_top_tracks(artist_id, exclude_ids, limit)
 
+    def _lookup_seed_artist(self, seed: str) -> str | None:
         # Try artist search first (best for radio seed like "Radiohead")
         results = self._sp.search(q=seed, type="artist", limit=1)
         items = results.get("artists", {}).get("items", [])
         if items:
-            artist_id = items[0]["id"]
-        else:
-            # Fall back to track search → get artist from track
-            results = self._sp.search(q=seed, type="track", limit=1)
-            items = results.get("tracks", {}).get("items", [])
-            if not items:
-                return []
-            artist_id = items[0]["artists"][0]["id"]
-
-        return self._related_top_tracks(artist_id, exclude_ids, limit)
+            return items[0]["id"]
+        # Fall back to track search → get artist from track
+        results = self._sp.search(q=seed, type="track", limit=1)
+        items = results.get("tracks", {}).get("items", [])
+        if not items:
+            return None
+        return items[0]["artists"][0]["id"]
 
     def resolve_track(self, track_id: str) -> list[str]:
         if not self._sp:
             return []
         try:
-            track = self._sp.track(track_id)
+            track = self._cache.get_or_fetch(("track", track_id), lambda: self._sp.track(track_id))
         except Exception as exc:
             log.warning("Spotify resolve_track failed: %s", exc)
             return []
@@ -168,6 +193,11 @@ class SpotifyResolver:
     def resolve_playlist(self, playlist_id: str) -> list[str]:
         if not self._sp:
             return []
+        return list(self._cache.get_or_fetch(
+            ("playlist", playlist_id), lambda: self._fetch_playlist(playlist_id)
+        ))
+
+    def _fetch_playlist(self, playlist_id: str) -> tuple[str, ...]:
         results: list[str] = []
         resp = self._sp.playlist_tracks(playlist_id)
         while resp:
@@ -176,11 +206,14 @@ class SpotifyResolver:
                 if track:
                     results.append(self._format_track(track))
             resp = self._sp.next(resp) if resp.get("next") else None
-        return results
+        return tuple(results)
 
     def resolve_album(self, album_id: str) -> list[str]:
         if not self._sp:
             return []
+        return list(self._cache.get_or_fetch(("album", album_id), lambda: self._fetch_album(album_id)))
+
+    def _fetch_album(self, album_id: str) -> tuple[str, ...]:
         results: list[str] = []
         resp = self._sp.album_tracks(album_id)
         while resp:
@@ -188,4 +221,4 @@ class SpotifyResolver:
                 artists = ", ".join(a.get("name", "Unknown") for a in track.get("artists", []))
                 results.append(f"{artists} - {track.get('name', 'Unknown')}")
             resp = self._sp.next(resp) if resp.get("next") else None
-        return results
+        return tuple(results)
@@ -100,7 +100,7 @@ async def set_volume(request: web.Request) -> web.Response:
         if vc and vc.source and hasattr(vc.source, "volume"):
             vc.source.volume = gq.volume
 
-    cog.queues.save_settings()
+    cog.mark_settings_dirty(guild_id)
     return web.json_response({"volume": level})
 
 